@@ -6,6 +6,14 @@ __version__ = "0.1.0"
 
 # Import base classes and scrapers for easier access
 from .base_scraper import BaseScraper
-from .tinyview_scraper import TinyviewScraper
 
-__all__ = ['BaseScraper', 'TinyviewScraper'] 
\ No newline at end of file
+__all__ = ['BaseScraper', 'TinyviewScraper']
+
+
+def __getattr__(name):
+    # TinyviewScraper pulls in Selenium, so only import it when it's asked for;
+    # feed generation and HTTP-only scrapers then never pay for it.
+    if name == 'TinyviewScraper':
+        from .tinyview_scraper import TinyviewScraper
+        return TinyviewScraper
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
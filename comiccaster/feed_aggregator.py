@@ -7,6 +7,7 @@ This module handles combining multiple comic feeds into a single feed.
 import os
 import json
 import logging
+from calendar import timegm
 from typing import List, Dict, Optional, Any
 from datetime import datetime, timedelta
 import pytz
@@ -61,7 +62,8 @@ class FeedAggregator:
                 'title': entry.title,
                 'link': entry.link,
                 'description': entry.description,
-                'published': datetime.fromtimestamp(entry.published_parsed.timestamp()),
+                # published_parsed is a UTC time.struct_time
+                'published': datetime.fromtimestamp(timegm(entry.published_parsed), tz=pytz.UTC),
                 'comic': comic_slug
             })
             
@@ -5,29 +5,233 @@ Generates RSS feeds for individual comics using the feedgen library, with
 multi-image support.
 """
 
+import hashlib
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional
-import time
-import feedparser
-from email.utils import parsedate_to_datetime
+from types import MappingProxyType
+from typing import Dict, List, Optional, Tuple
+import json
+from email.utils import format_datetime, parsedate_to_datetime
 import re
-import pytz
 
 from feedgen.feed import FeedGenerator
 from feedgen.entry import FeedEntry
+from lxml import etree
+from jinja2 import DictLoader, Environment, FileSystemBytecodeCache
+from markupsafe import Markup
+
+# dateutil is only the last-resort parser for unusual date formats, so keep it
+# optional and resolve it once here rather than inside the per-entry fallback.
+try:
+    from dateutil import parser as _dateutil_parser
+except ImportError:
+    _dateutil_parser = None
+
+# orjson is an optional, faster codec for the feed index sidecars.
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+
+def _json_dumps(obj) -> bytes:
+    """Encode obj as UTF-8 JSON, with orjson when it is installed."""
+    if _orjson is not None:
+        return _orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+
+def _json_loads(data: bytes):
+    """Decode UTF-8 JSON; orjson.JSONDecodeError is a ValueError like json's."""
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
+_UTC = timezone.utc
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_cached(date_str: str) -> datetime:
+    """
+    Parse a date string into a timezone-aware datetime, defaulting to UTC.
+
+    Feeds are rebuilt from the same date strings over and over, so results are
+    memoized. Unparseable input raises rather than returning a fallback, which
+    keeps failures out of the cache.
+    """
+    # ISO 8601 input starts with a digit, so only then is the C-level
+    # fromisoformat worth trying; RFC 2822 comes next, and dateutil is the
+    # last resort once both specialized parsers have failed.
+    dt = None
+    if date_str[:1].isdigit():
+        try:
+            dt = datetime.fromisoformat(date_str)
+        except ValueError:
+            pass
+    if dt is None:
+        try:
+            dt = parsedate_to_datetime(date_str)
+        except (TypeError, ValueError):
+            pass
+    if dt is None:
+        if _dateutil_parser is None:
+            raise ValueError("unrecognized date format")
+        dt = _dateutil_parser.parse(date_str)
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=_UTC)
+    return dt
+
+
+# Library module: leave logging configuration to the application (see main()).
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# lastBuildDate changes on every build, so it is left out of the content hash.
+_LAST_BUILD_DATE_RE = re.compile(rb'<lastBuildDate>[^<]*</lastBuildDate>')
+
+# Characters lxml refuses in element text (XML 1.0 Char production).
+_INVALID_XML_CHARS_RE = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]')
+
+
+def _xml_text(value: str) -> str:
+    """Escape element text the way lxml serializes it."""
+    value = value.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+    return value.replace('\r', '&#13;') if '\r' in value else value
+
+
+# Feeds run to hundreds of KB; write them in one large block.
+_WRITE_BUFFER_SIZE = 1 << 20
+
+
+def _feed_etag(xml_bytes: bytes) -> str:
+    """ETag for a serialized feed; ignores lastBuildDate so rebuilds of unchanged content match."""
+    return hashlib.sha256(_LAST_BUILD_DATE_RE.sub(b'', xml_bytes)).hexdigest()
+
+
+def write_feed_etag(feed_path: Path, etag: str) -> None:
+    """Record a feed's ETag in `<slug>.xml.etag`, stamped with the feed file's mtime and size."""
+    stat = feed_path.stat()
+    feed_path.with_name(f"{feed_path.name}.etag").write_text(
+        f"{etag} {stat.st_mtime_ns} {stat.st_size}"
+    )
+
+
+def read_feed_etag(feed_path: Path) -> Optional[str]:
+    """
+    Return the ETag recorded for a feed, or None if there is none or it is stale.
+
+    The sidecar is only trusted while the feed file still has the mtime and
+    size it was stamped with; a feed replaced outside the generator (git pull,
+    manual copy) invalidates it.
+    """
+    try:
+        etag, mtime_ns, size = feed_path.with_name(f"{feed_path.name}.etag").read_text().split()
+        stat = feed_path.stat()
+    except (OSError, ValueError):
+        return None
+    if (str(stat.st_mtime_ns), str(stat.st_size)) != (mtime_ns, size):
+        return None
+    return etag
+
+
+def _index_record(item: etree._Element, entry_id: str, pub_date: datetime) -> Dict[str, str]:
+    """Index record for an <item>: id, UTC ISO date (sortable as text), link and raw XML."""
+    # Re-home the children so the fragment doesn't carry the feed's xmlns declarations.
+    fragment = etree.Element('item')
+    fragment.extend(list(item))
+    return {
+        'id': entry_id,
+        'date': pub_date.astimezone(timezone.utc).isoformat(),
+        'link': fragment.findtext('link'),
+        'xml': etree.tostring(fragment, encoding='unicode'),
+    }
+
+
+# Human-readable display name for each source key, used in feed titles.
+SOURCE_DISPLAY = MappingProxyType({
+    'gocomics-daily': 'GoComics',
+    'gocomics-political': 'GoComics Political',
+    'tinyview': 'TinyView',
+    'comicskingdom': 'Comics Kingdom',
+    'creators': 'Creators',
+    'newyorker': 'The New Yorker',
+    'farside-daily': 'The Far Side',
+    'farside-new': 'The Far Side',
+    'mrboffo': 'Neatly Chiseled Features',
+})
+
+# Feed TTL (minutes) by update_recommendation: 24 hours / 7 days.
+TTL_TABLE = MappingProxyType({'daily': '1440', 'weekly': '10080'})
+
+POLITICAL_DESC_FMT = ("Political editorial cartoon by {author} from {source}. "
+                      "May contain political content and commentary on current events.")
+DAILY_DESC_FMT = "Daily {name} comic strip by {author} from {source}"
+FEED_URL_FMT = "https://comiccaster.xyz/feeds/{slug}.xml"
+
+# The single-image layout is small enough that Markup.format, which escapes
+# each argument with markupsafe's C escaper, beats a template render.
+_SINGLE_IMAGE_HTML = Markup(
+    '<div style="text-align: center; max-width: 700px; margin: 0 auto;">'
+    '<img src="{image_url}" alt="{alt}" style="max-width: 100%; height: auto;" loading="lazy">'
+    '</div>'
+)
+_SINGLE_IMAGE_CAPTION_HTML = Markup('<p style="margin-top: 10px; font-style: italic;">{description}</p>')
+
+_GALLERY_SOURCE = """\
+<div class="comic-gallery" style="text-align: center; max-width: 700px; margin: 10px auto;">
+{% if description %}
+<p style="margin-bottom: 15px; font-style: italic;">{{ description }}</p>
+{% endif %}
+{% for panel in panels %}
+    <div class="comic-panel" style="margin: 15px 0;">
+        <img src="{{ panel.url }}" alt="{{ panel.alt }}" {% if panel.title %}title="{{ panel.title }}" {% endif %}style="max-width: 100%; height: auto;" loading="lazy">
+{% if panel.caption %}
+        <div class="panel-description" style="font-size: 0.9em; color: #666; margin-top: 5px; font-style: italic;">{{ panel.caption }}</div>
+{% endif %}
+    </div>
+{% endfor %}
+</div>
+"""
+
+
+def _bytecode_cache() -> Optional[FileSystemBytecodeCache]:
+    """
+    Return a bytecode cache for the templates that persists across runs.
+
+    The directory comes from COMICCASTER_JINJA_CACHE (default `.jinja_cache`);
+    templates are simply compiled in memory if it can't be created or written.
+    """
+    directory = os.environ.get('COMICCASTER_JINJA_CACHE', '.jinja_cache')
+    try:
+        os.makedirs(directory, exist_ok=True)
+    except OSError:
+        return None
+    return FileSystemBytecodeCache(directory) if os.access(directory, os.W_OK) else None
+
+
+# Entry description templates, compiled once per process and loaded from the
+# bytecode cache after the first run. Autoescaping covers the scraped URLs and
+# alt/title text; the description itself is pre-rendered HTML from the
+# generators and is passed in as Markup.
+_TEMPLATE_ENV = Environment(loader=DictLoader({'gallery.html': _GALLERY_SOURCE}),
+                            bytecode_cache=_bytecode_cache(), autoescape=True,
+                            trim_blocks=True, lstrip_blocks=True,
+                            keep_trailing_newline=True, cache_size=-1)
+_GALLERY_TMPL = _TEMPLATE_ENV.get_template('gallery.html')
 
 class ComicFeedGenerator:
     """Handles generating RSS feeds for individual comics."""
     
+    # Most recent entries kept by generate_feed by default; matches the
+    # 100-entry cap scripts/update_feeds.py applies to regenerated feeds.
+    MAX_ENTRIES = 100
+
     def __init__(self, base_url: str = "https://www.gocomics.com", output_dir: str = "feeds"):
         """
         Initialize the ComicFeedGenerator.
@@ -39,47 +243,43 @@ class ComicFeedGenerator:
         self.base_url = base_url
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        # Feed path -> ((mtime_ns, size), items) for feeds loaded or written here
+        self._items_cache: Dict[Path, Tuple[Tuple[int, int], List[Dict[str, str]]]] = {}
     
-    def create_feed(self, comic_info: Dict[str, str]) -> FeedGenerator:
+    def create_feed(self, comic_info: Dict[str, str], updated_time: Optional[datetime] = None) -> FeedGenerator:
         """
         Create a new feed for a comic.
         
         Args:
             comic_info (Dict[str, str]): Dictionary containing comic information.
+            updated_time (Optional[datetime]): The feed's lastBuildDate. Defaults
+                to now; batch builds pass one shared timestamp.
             
         Returns:
             FeedGenerator: A configured feed generator instance.
         """
         fg = FeedGenerator()
 
-        # Map the source key to a human-readable display name for the feed title.
         source = comic_info.get('source', 'gocomics-daily')
-        source_display = {
-            'gocomics-daily': 'GoComics',
-            'gocomics-political': 'GoComics Political',
-            'tinyview': 'TinyView',
-            'comicskingdom': 'Comics Kingdom',
-            'creators': 'Creators',
-            'newyorker': 'The New Yorker',
-            'farside-daily': 'The Far Side',
-            'farside-new': 'The Far Side',
-            'mrboffo': 'Neatly Chiseled Features'
-        }.get(source, 'GoComics')
+        source_display = SOURCE_DISPLAY.get(source, 'GoComics')
         
         fg.title(f"{comic_info['name']} - {source_display}")
 
         # Description wording differs for political/editorial comics.
         if comic_info.get('is_political'):
-            fg.description(f"Political editorial cartoon by {comic_info.get('author', comic_info['name'])} from {source_display}. May contain political content and commentary on current events.")
+            fg.description(POLITICAL_DESC_FMT.format(
+                author=comic_info.get('author', comic_info['name']), source=source_display))
         else:
-            fg.description(f"Daily {comic_info['name']} comic strip by {comic_info.get('author', 'Unknown Author')} from {source_display}")
+            fg.description(DAILY_DESC_FMT.format(
+                name=comic_info['name'], author=comic_info.get('author', 'Unknown Author'),
+                source=source_display))
         fg.language('en')
 
         fg.category(term=source, label=source_display)
 
         comic_url = comic_info.get('url', f"https://www.gocomics.com/{comic_info.get('slug', '')}")
         fg.id(comic_url)
-        fg.updated(datetime.now(timezone.utc))
+        fg.updated(updated_time or datetime.now(timezone.utc))
 
         if comic_info.get('author'):
             fg.author({'name': comic_info['author']})
@@ -90,22 +290,12 @@ class ComicFeedGenerator:
         else:
             fg.category(term='comics', label='Comic Strips')
         
-        # Set TTL (minutes) based on how often the comic updates.
-        update_rec = comic_info.get('update_recommendation', 'daily')
-        if update_rec == 'daily':
-            fg.ttl('1440')  # 24 hours in minutes
-        elif update_rec == 'weekly':
-            fg.ttl('10080')  # 7 days in minutes
-        else:
-            # Smart/irregular - check every 2 days
-            fg.ttl('2880')  # 48 hours in minutes
+        # Smart/irregular comics fall back to checking every 2 days.
+        fg.ttl(TTL_TABLE.get(comic_info.get('update_recommendation', 'daily'), '2880'))
 
         # atom:link self-reference, then the main feed link to the comic's URL.
         # The self-reference must be added first.
-        feed_url = f"https://comiccaster.xyz/feeds/{comic_info['slug']}.xml"
-        fg.link(href=feed_url, rel='self', type='application/rss+xml')
-
-        comic_url = comic_info.get('url', f"https://www.gocomics.com/{comic_info.get('slug', '')}")
+        fg.link(href=FEED_URL_FMT.format(slug=comic_info['slug']), rel='self', type='application/rss+xml')
         fg.link(href=comic_url)
         
         return fg
@@ -119,62 +309,77 @@ class ComicFeedGenerator:
         """
         # Wrap image in a centering div with a consistent max-width so all comics
         # render at the same size regardless of source image dimensions.
-        img_html = (
-            f'<div style="text-align: center; max-width: 700px; margin: 0 auto;">'
-            f'<img src="{image_url}" alt="{comic_info.get("name", "Comic strip")}" '
-            f'style="max-width: 100%; height: auto;" loading="lazy">'
-            f'</div>'
-        )
-
-        # Append the text description only if it has no image of its own.
+        # The text description is appended only if it has no image of its own.
+        html = _SINGLE_IMAGE_HTML.format(image_url=image_url, alt=comic_info.get("name", "Comic strip"))
         if description and '<img' not in description:
-            return f'{img_html}<p style="margin-top: 10px; font-style: italic;">{description}</p>'
-
-        return img_html
+            html += _SINGLE_IMAGE_CAPTION_HTML.format(description=Markup(description))
+        return str(html)
     
     def _create_multi_image_content(self, images: List[Dict[str, str]], description: str, comic_info: Dict[str, str]) -> str:
         """Create HTML content for multi-image comics with responsive gallery layout."""
         if not images:
             return description
 
-        # max-width: 700px ensures consistent sizing across all comic sources.
-        gallery_html = '<div class="comic-gallery" style="text-align: center; max-width: 700px; margin: 10px auto;">\n'
-
-        if description:
-            gallery_html += f'<p style="margin-bottom: 15px; font-style: italic;">{description}</p>\n'
-
+        panels = []
         for i, image in enumerate(images):
             image_url = image.get('url', '')
             if not image_url:
                 continue
-                
-            alt_text = image.get('alt', f"{comic_info.get('name', 'Comic')} - Panel {i+1}")
-            title_text = image.get('title', '')
-
-            img_style = (
-                "max-width: 100%; "
-                "height: auto;"
-            )
-            
-            gallery_html += f'    <div class="comic-panel" style="margin: 15px 0;">\n'
-            gallery_html += f'        <img src="{image_url}" '
-            gallery_html += f'alt="{alt_text}" '
-            if title_text:
-                gallery_html += f'title="{title_text}" '
-            gallery_html += f'style="{img_style}" '
-            gallery_html += f'loading="lazy">\n'
-            
-            # Add panel description if available in alt text (for screen readers)
-            # Skip if alt text is just a URL (e.g. TinyView sets alt=src URL)
-            if alt_text and alt_text != f"{comic_info.get('name', 'Comic')} - Panel {i+1}" and not alt_text.startswith(('http://', 'https://')):
-                gallery_html += f'        <div class="panel-description" style="font-size: 0.9em; color: #666; margin-top: 5px; font-style: italic;">{alt_text}</div>\n'
-            
-            gallery_html += f'    </div>\n'
-        
-        gallery_html += '</div>\n'
-        
-        return gallery_html
+
+            default_alt = f"{comic_info.get('name', 'Comic')} - Panel {i+1}"
+            alt_text = image.get('alt', default_alt)
+
+            # Show the alt text as a panel description (for screen readers), unless
+            # it's the generated default or just a URL (e.g. TinyView sets alt=src URL)
+            show_caption = alt_text and alt_text != default_alt and not alt_text.startswith(('http://', 'https://'))
+            panels.append({
+                'url': image_url,
+                'alt': alt_text,
+                'title': image.get('title', ''),
+                'caption': alt_text if show_caption else '',
+            })
+
+        # max-width: 700px ensures consistent sizing across all comic sources.
+        return _GALLERY_TMPL.render(panels=panels, description=Markup(description) if description else '')
     
+    def _write_feed(self, xml_bytes: bytes, feed_path: Path) -> bool:
+        """
+        Write a serialized feed to disk, skipping the write if its content is unchanged.
+
+        An ETag (SHA-256 of the feed minus its lastBuildDate, so a weak
+        validator) and an RFC 2822 last-modified time are kept beside the feed
+        as `<slug>.xml.etag` and `<slug>.xml.lastmod` so the web layer can
+        answer conditional requests; see read_feed_etag.
+
+        Args:
+            xml_bytes (bytes): The serialized feed.
+            feed_path (Path): Destination of the RSS file.
+
+        Returns:
+            bool: True if the feed file was written, False if it was unchanged.
+        """
+        etag = _feed_etag(xml_bytes)
+
+        if read_feed_etag(feed_path) == etag:
+            logger.info(f"Feed content unchanged, skipping write of {feed_path}")
+            return False
+
+        # Write to a temp file and rename it into place so a failed write
+        # never leaves a truncated feed behind.
+        tmp_path = feed_path.with_name(f"{feed_path.name}.tmp")
+        try:
+            with open(tmp_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+                f.write(xml_bytes)
+            os.replace(tmp_path, feed_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        write_feed_etag(feed_path, etag)
+        feed_path.with_name(f"{feed_path.name}.lastmod").write_text(
+            format_datetime(datetime.now(timezone.utc), usegmt=True)
+        )
+        return True
+
     def create_feed_object(self, comic_info: Dict[str, str]) -> FeedGenerator:
         """Alias for create_feed (kept for test compatibility)."""
         return self.create_feed(comic_info)
@@ -205,47 +410,36 @@ class ComicFeedGenerator:
         Returns:
             datetime: Datetime object with timezone information.
         """
+        if isinstance(date_str, datetime):
+            # Default a naive datetime to UTC.
+            return date_str if date_str.tzinfo is not None else date_str.replace(tzinfo=_UTC)
+
         try:
-            if isinstance(date_str, datetime):
-                dt = date_str
-            else:
-                # Try RFC 2822, then a bare YYYY-MM-DD, then dateutil as a last resort.
-                try:
-                    dt = parsedate_to_datetime(date_str)
-                except Exception:
-                    try:
-                        if re.match(r'^\d{4}-\d{2}-\d{2}$', date_str):
-                            dt = datetime.strptime(date_str, '%Y-%m-%d')
-                            dt = pytz.UTC.localize(dt)
-                        else:
-                            from dateutil import parser as date_parser
-                            dt = date_parser.parse(date_str)
-                            if dt.tzinfo is None:
-                                dt = pytz.UTC.localize(dt)
-                    except Exception as e:
-                        logger.error(f"Failed to parse date string '{date_str}': {e}")
-                        dt = datetime.now(pytz.UTC)
-
-            # Default any naive datetime to UTC.
-            if dt.tzinfo is None:
-                dt = pytz.UTC.localize(dt)
-            
-            return dt
-            
+            return _parse_date_cached(date_str)
         except Exception as e:
-            logger.error(f"Error parsing date '{date_str}': {e}")
-            return datetime.now(pytz.UTC)
+            logger.error(f"Failed to parse date string '{date_str}': {e}")
+            return datetime.now(_UTC)
     
-    def create_entry(self, comic_info, metadata):
-        """Create a feed entry from comic metadata with multi-image support."""
-        entry = FeedEntry()
-
-        pub_date = self.parse_date_with_timezone(metadata.get('pub_date', ''))
-
-        title = metadata.get('title', f"{comic_info['name']} - {pub_date.strftime('%Y-%m-%d')}")
-        entry.title(title)
+    def _entry_id(self, comic_info: Dict[str, str], metadata: Dict[str, str], pub_date: datetime) -> str:
+        """Return the id create_entry gives an entry: metadata id, else url, else a date-based id."""
+        if 'id' in metadata:
+            return metadata['id']
+        if 'url' in metadata:
+            return metadata['url']
+        default_url = comic_info.get('url', f"https://example.com/{comic_info.get('slug', 'comic')}")
+        return f"{default_url}#{pub_date.isoformat()}"
+
+    def _entry_fields(self, comic_info: Dict[str, str], metadata: Dict[str, str],
+                      pub_date: datetime) -> Tuple[str, str, str]:
+        """Return the (title, link, description HTML) of an entry."""
+        # The date-derived title is a fallback; only format pub_date when the
+        # metadata doesn't already supply one.
+        if 'title' in metadata:
+            title = metadata['title']
+        else:
+            title = f"{comic_info['name']} - {pub_date.strftime('%Y-%m-%d')}"
 
-        entry.link(href=metadata.get('url', comic_info.get('url', f"https://example.com/{comic_info.get('slug', 'comic')}")))
+        link = metadata.get('url', comic_info.get('url', f"https://example.com/{comic_info.get('slug', 'comic')}"))
 
         description = metadata.get('description', '')
 
@@ -260,21 +454,205 @@ class ComicFeedGenerator:
             if image_url:
                 description = self._create_single_image_content(image_url, description, comic_info)
 
+        return title, link, description
+
+    def create_entry(self, comic_info, metadata, *, pub_date=None):
+        """Create a feed entry from comic metadata with multi-image support.
+
+        Callers that have already parsed the entry's date can pass it as
+        pub_date to skip parsing it again.
+        """
+        entry = FeedEntry()
+
+        if pub_date is None:
+            pub_date = self.parse_date_with_timezone(metadata.get('pub_date', ''))
+
+        title, link, description = self._entry_fields(comic_info, metadata, pub_date)
+        entry.title(title)
+        entry.link(href=link)
         entry.description(description)
 
         entry.published(pub_date)
 
-        default_url = comic_info.get('url', f"https://example.com/{comic_info.get('slug', 'comic')}")
-        entry.id(metadata.get('id', metadata.get('url', f"{default_url}#{pub_date.isoformat()}")))
+        entry.id(self._entry_id(comic_info, metadata, pub_date))
 
         if comic_info.get('is_political'):
             entry.category(term='political', label='Political Comics')
         
         return entry
+
+    def _render_item(self, comic_info: Dict[str, str], metadata: Dict[str, str], pub_date: datetime) -> str:
+        """
+        Render an entry's <item> XML directly, without building a FeedEntry.
+
+        Produces the same bytes feedgen's rss_entry() serializes to, for the
+        fields create_entry sets.
+        """
+        title, link, description = self._entry_fields(comic_info, metadata, pub_date)
+        return self._item_xml(comic_info, title, link, description,
+                              self._entry_id(comic_info, metadata, pub_date), pub_date)
+
+    def _item_xml(self, comic_info: Dict[str, str], title: str, link: str, description: str,
+                  entry_id: str, pub_date: datetime) -> str:
+        """Serialize already computed entry fields as an <item> element."""
+        if not (title or description):
+            raise ValueError('Required fields not set')
+        if _INVALID_XML_CHARS_RE.search(f"{title}{link}{description}{entry_id}"):
+            raise ValueError("All strings must be XML compatible")
+
+        parts = ['<item>']
+        if title:
+            parts.append(f'<title>{_xml_text(title)}</title>')
+        if link:
+            parts.append(f'<link>{_xml_text(link)}</link>')
+        if description:
+            parts.append(f'<description>{_xml_text(description)}</description>')
+        if entry_id:
+            parts.append(f'<guid isPermaLink="false">{_xml_text(entry_id)}</guid>')
+        if comic_info.get('is_political'):
+            parts.append('<category>Political Comics</category>')
+        # format_datetime spells day/month names itself, so unlike strftime it
+        # can't pick up a non-C locale (feedgen swaps the locale to avoid that).
+        parts.append(f"<pubDate>{format_datetime(pub_date)}</pubDate></item>")
+        return ''.join(parts)
     
+    def _load_index(self, feed_path: Path) -> Optional[List[Dict[str, str]]]:
+        """
+        Load the item index kept beside a feed by update_feed.
+
+        The index (`<slug>.index.json`) records the (mtime_ns, size) of the
+        feed file it was built for, so it is ignored once that file changes,
+        whether generate_feed rewrote it or it was replaced outside the
+        generator (a git pull or checkout of the tracked feeds, a manual copy).
+
+        Args:
+            feed_path (Path): Path of the RSS file the index belongs to.
+
+        Returns:
+            Optional[List[Dict[str, str]]]: The indexed items, newest first, or
+            None if the index is missing or stale.
+        """
+        stamp = self._feed_stamp(feed_path)
+        if stamp is None:
+            return None
+        try:
+            index = _json_loads(feed_path.with_suffix('.index.json').read_bytes())
+        except (OSError, ValueError):
+            return None
+        if index.get('stamp') != list(stamp):
+            return None
+        return index['items']
+
+    def _load_items_from_feed(self, feed_path: Path) -> List[Dict[str, str]]:
+        """
+        Rebuild the item index from an existing feed file.
+
+        Args:
+            feed_path (Path): Path of the RSS file to read.
+
+        Returns:
+            List[Dict[str, str]]: One index record per <item>, in feed order.
+        """
+        items = []
+        if not feed_path.exists():
+            return items
+        try:
+            # Stream the items and drop each once indexed, so memory stays
+            # flat however long the feed has grown.
+            for _, item in etree.iterparse(str(feed_path), events=('end',), tag='item'):
+                pub_date = self.parse_date_with_timezone(item.findtext('pubDate', ''))
+                items.append(_index_record(item, item.findtext('guid'), pub_date))
+                item.clear()
+                while item.getprevious() is not None:
+                    del item.getparent()[0]
+        except (OSError, etree.XMLSyntaxError) as e:
+            logger.error(f"Error loading existing feed: {e}")
+        return items
+
+    def _feed_stamp(self, feed_path: Path) -> Optional[Tuple[int, int]]:
+        """Return the feed file's (mtime_ns, size), or None if it doesn't exist."""
+        try:
+            stat = feed_path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _cache_items(self, feed_path: Path, items: List[Dict[str, str]]) -> None:
+        """Remember a feed's items until the feed file changes."""
+        stamp = self._feed_stamp(feed_path)
+        if stamp is not None:
+            self._items_cache[feed_path] = (stamp, items)
+
+    def _load_existing(self, feed_path: Path) -> List[Dict[str, str]]:
+        """Return the feed's indexed items, rebuilding them from the XML if the index is unusable."""
+        cached = self._items_cache.get(feed_path)
+        if cached is not None and cached[0] == self._feed_stamp(feed_path):
+            return cached[1]
+        items = self._load_index(feed_path)
+        if items is None:
+            items = self._load_items_from_feed(feed_path)
+        self._cache_items(feed_path, items)
+        return items
+
+    def _merge_items(self, comic_info: Dict[str, str], items: List[Dict[str, str]],
+                     entries: List[Dict[str, str]]) -> Tuple[List[Dict[str, str]], int]:
+        """
+        Merge new entries into a feed's indexed items.
+
+        Entries whose id is already published are skipped. A new entry replaces
+        any item sharing its publication date, including an earlier entry from
+        the same batch.
+
+        Returns:
+            Tuple[List[Dict[str, str]], int]: The merged items, newest first,
+            and the number of entries added.
+        """
+        seen_ids = {item['id'] for item in items}
+        new_by_date = {}
+        for metadata in entries:
+            # The entry id is known before the entry is built, so an already
+            # published strip is skipped without rendering anything.
+            pub_date = self.parse_date_with_timezone(metadata.get('pub_date', ''))
+            entry_id = self._entry_id(comic_info, metadata, pub_date)
+            if entry_id in seen_ids:
+                logger.info(f"Entry with ID {entry_id} already exists, skipping")
+                continue
+            seen_ids.add(entry_id)
+            # Render straight to XML; a FeedEntry would only be serialized and discarded.
+            title, link, description = self._entry_fields(comic_info, metadata, pub_date)
+            item = {
+                'id': entry_id,
+                'date': pub_date.astimezone(timezone.utc).isoformat(),
+                'link': link or None,
+                'xml': self._item_xml(comic_info, title, link, description, entry_id, pub_date),
+            }
+            new_by_date[item['date']] = item
+
+        merged = [item for item in items if item['date'] not in new_by_date]
+        merged.extend(new_by_date.values())
+        merged.sort(key=lambda item: item['date'], reverse=True)
+        return merged, len(new_by_date)
+
+    def _write_items(self, comic_info: Dict[str, str], feed_path: Path, items: List[Dict[str, str]]) -> None:
+        """Write a feed from indexed items, splicing their XML into an empty channel, and save the index."""
+        channel = self.create_feed(comic_info).rss_str()
+        items_xml = ''.join(item['xml'] for item in items).encode('utf-8')
+        xml_bytes = channel.replace(b'</channel>', items_xml + b'</channel>', 1)
+        self._write_feed(xml_bytes, feed_path)
+
+        # Stamp the index with the file as it now stands on disk.
+        stamp = self._feed_stamp(feed_path)
+        feed_path.with_suffix('.index.json').write_bytes(
+            _json_dumps({'stamp': list(stamp), 'items': items})
+        )
+        self._cache_items(feed_path, items)
+
     def update_feed(self, comic_info: Dict[str, str], metadata: Dict[str, str]) -> bool:
         """
         Update a comic's feed with a new entry.
+
+        Only the new entry is rendered; existing items are carried over as raw
+        XML from the feed's index, so an update doesn't re-parse the whole feed.
         
         Args:
             comic_info (Dict[str, str]): Dictionary containing comic information.
@@ -283,64 +661,58 @@ class ComicFeedGenerator:
         Returns:
             bool: True if the feed was updated successfully, False otherwise.
         """
-        try:
-            feed_path = self.output_dir / f"{comic_info['slug']}.xml"
+        return self.update_feed_batch(comic_info, [metadata])
 
-            fg = self.create_feed(comic_info)
-            existing_entries = []
+    def update_feed_batch(self, comic_info: Dict[str, str], entries: List[Dict[str, str]]) -> bool:
+        """
+        Update a comic's feed with several new entries, writing it once.
 
-            # Carry over entries from the existing feed file, if any.
-            if feed_path.exists():
-                try:
-                    existing_feed = feedparser.parse(str(feed_path))
-                    for entry in existing_feed.entries:
-                        try:
-                            if hasattr(entry, 'published_parsed'):
-                                pub_date = datetime.fromtimestamp(time.mktime(entry.published_parsed))
-                                if pub_date.tzinfo is None:
-                                    pub_date = pytz.UTC.localize(pub_date)
-                            else:
-                                pub_date = datetime.now(pytz.UTC)
-
-                            existing_entries.append({
-                                'entry': entry,
-                                'date': pub_date
-                            })
-                        except Exception as e:
-                            logger.error(f"Error processing existing entry: {e}")
-                            continue
-                except Exception as e:
-                    logger.error(f"Error loading existing feed: {e}")
+        Equivalent to calling update_feed for each entry in order, but the
+        existing items are loaded and the feed is written only once.
+
+        Args:
+            comic_info (Dict[str, str]): Dictionary containing comic information.
+            entries (List[Dict[str, str]]): Comic strip metadata dictionaries.
 
-            new_entry = self.create_entry(comic_info, metadata)
-            fg.add_entry(new_entry)
+        Returns:
+            bool: True if the feed was updated successfully, False otherwise.
+        """
+        try:
+            feed_path = self.output_dir / f"{comic_info['slug']}.xml"
 
-            # Re-add existing entries, skipping any that share the new entry's date.
-            new_pub_date = new_entry.published()
-            for entry_data in existing_entries:
-                if entry_data['date'] != new_pub_date:
-                    fg.add_entry(entry_data['entry'])
+            items, added = self._merge_items(comic_info, self._load_existing(feed_path), entries)
+            if not added:
+                # Nothing new to publish; rewriting would only churn the file.
+                logger.info(f"No new entries for {comic_info['name']}, no changes to write")
+                return True
 
-            fg.rss_file(str(feed_path))
+            self._write_items(comic_info, feed_path, items)
             return True
             
         except Exception as e:
             logger.error(f"Error updating feed for {comic_info['name']}: {e}")
             return False
     
-    def generate_feed(self, comic_info: Dict[str, str], entries: List[Dict[str, str]]) -> bool:
+    def generate_feed(self, comic_info: Dict[str, str], entries: List[Dict[str, str]], *,
+                      use_fast: bool = True, updated_time: Optional[datetime] = None,
+                      max_entries: Optional[int] = None) -> bool:
         """
         Generate a complete feed for a comic with multiple entries.
         
         Args:
             comic_info (Dict[str, str]): Dictionary containing comic information.
             entries (List[Dict[str, str]]): List of comic strip metadata dictionaries.
+            use_fast (bool): Render the <item> elements directly instead of through
+                feedgen. Both produce identical output; the feedgen path is kept
+                for parity testing.
+            updated_time (Optional[datetime]): The feed's lastBuildDate; defaults to now.
+            max_entries (Optional[int]): Most recent entries to keep; defaults to MAX_ENTRIES.
             
         Returns:
             bool: True if the feed was generated successfully, False otherwise.
         """
         try:
-            fg = self.create_feed(comic_info)
+            fg = self.create_feed(comic_info, updated_time)
 
             entries_with_dates = []
             seen_ids = set()  # Dedupe entries by unique ID/URL.
@@ -354,32 +726,41 @@ class ComicFeedGenerator:
                         logger.debug(f"Skipping duplicate entry: {entry_id}")
                         continue
 
-                    entries_with_dates.append({
-                        'metadata': metadata,
-                        'pub_date': pub_date
-                    })
+                    entries_with_dates.append((pub_date, metadata))
                     if entry_id:
                         seen_ids.add(entry_id)
                 except Exception as e:
                     logger.error(f"Error processing entry: {e}")
                     continue
 
-            # Sort oldest-first: feedgen prepends entries, so this yields newest-first output.
-            entries_with_dates.sort(key=lambda x: x['pub_date'])
+            # Newest first, keeping only the most recent max_entries.
+            entries_with_dates.sort(key=itemgetter(0), reverse=True)
+            del entries_with_dates[self.MAX_ENTRIES if max_entries is None else max_entries:]
+            # feedgen prepends entries, so hand it the oldest first.
+            ordered = entries_with_dates if use_fast else reversed(entries_with_dates)
 
             feed_entry_count = 0
-            for entry_data in entries_with_dates:
+            items = []
+            for pub_date, metadata in ordered:
                 try:
-                    fe = self.create_entry(comic_info, entry_data['metadata'])
-                    fg.add_entry(fe)
+                    if use_fast:
+                        items.append(self._render_item(comic_info, metadata, pub_date))
+                    else:
+                        fg.add_entry(self.create_entry(comic_info, metadata, pub_date=pub_date))
                     feed_entry_count += 1
-                    logger.debug(f"Added entry: {entry_data['metadata'].get('title')} - {entry_data['pub_date']}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"Added entry: {metadata.get('title')} - {pub_date}")
                 except Exception as entry_error:
                     logger.error(f"Error adding entry to feed: {entry_error}")
                     continue
 
+            xml_bytes = fg.rss_str()
+            if use_fast:
+                items_xml = ''.join(items).encode('utf-8')
+                xml_bytes = xml_bytes.replace(b'</channel>', items_xml + b'</channel>', 1)
+
             feed_path = self.output_dir / f"{comic_info['slug']}.xml"
-            fg.rss_file(str(feed_path))
+            self._write_feed(xml_bytes, feed_path)
             logger.info(f"Generated feed for {comic_info['name']} at {feed_path} with {feed_entry_count} entries")
             
             return True
@@ -388,8 +769,36 @@ class ComicFeedGenerator:
             logger.error(f"Error updating feed for {comic_info['name']}: {e}")
             return False
 
+    @classmethod
+    def generate_all(cls, jobs: List[Tuple[Dict[str, str], List[Dict[str, str]]]],
+                     max_workers: Optional[int] = None, **kwargs) -> List[bool]:
+        """
+        Generate many feeds concurrently.
+
+        Each feed is written to its own file, so the jobs are independent and
+        are fanned out over a thread pool sharing one generator. All feeds in
+        the batch share one lastBuildDate.
+
+        Args:
+            jobs: (comic_info, entries) pairs, as passed to generate_feed.
+            max_workers (Optional[int]): Thread count; defaults to os.cpu_count().
+            **kwargs: Passed to the ComicFeedGenerator constructor.
+
+        Returns:
+            List[bool]: generate_feed's result for each job, in order.
+        """
+        generator = cls(**kwargs)
+        updated_time = datetime.now(timezone.utc)
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            return list(executor.map(
+                lambda job: generator.generate_feed(*job, updated_time=updated_time), jobs))
+
 def main():
     """Main function to demonstrate the ComicFeedGenerator usage."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
     try:
         comic_info = {
             'name': 'Garfield',
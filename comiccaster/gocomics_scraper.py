@@ -7,25 +7,71 @@ with a Selenium fallback.
 """
 
 import logging
+import re
+import threading
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple, Union
 from urllib.parse import urljoin, urlparse
 
-import requests
-from bs4 import BeautifulSoup
-from selenium import webdriver
-from selenium.webdriver.firefox.options import Options
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.by import By
-from selenium.common.exceptions import TimeoutException
+from bs4 import BeautifulSoup, SoupStrainer
 
 from .base_scraper import BaseScraper
+from .http_client import ComicHTTPClient
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Either the comic <picture> or its og:image meta tag in the raw bytes means
+# extract_images can work from the plain HTTP response; without both the page
+# needs a browser.
+_SERVER_RENDERED_RE = re.compile(rb'item-comic-image|property=["\']og:image["\']')
+
+# Pre-filter for the img fallback; the hostname is still checked with urlparse
+_ASSET_SRC_RE = re.compile(r'//assets\.amuniversal\.com/', re.IGNORECASE)
+
+# Run in the browser after the Selenium wait: the extractors only read <head>
+# and the comic <picture>, so return just those instead of serializing the whole
+# rendered page; pages without the comic <picture> come back whole.
+_COMIC_MARKUP_JS = '''
+const picture = document.querySelector('picture.item-comic-image');
+if (!picture) { return document.documentElement.outerHTML; }
+return '<html>' + document.head.outerHTML + '<body>' + picture.outerHTML + '</body></html>';
+'''
+
+# Concurrent page fetches per scraper; kept modest to stay polite to GoComics
+MAX_FETCH_WORKERS = 8
+
+# libxml2-backed parser; much faster than the pure-Python 'html.parser'
+HTML_PARSER = 'lxml'
+
+# The extractors only look at these tags, so skip building the rest of the DOM
+_PAGE_STRAINER = SoupStrainer(['title', 'meta', 'picture', 'img'])
+
+
+def _as_soup(html_content: Union[str, BeautifulSoup]) -> BeautifulSoup:
+    """Return a parsed tree, parsing raw HTML only when needed."""
+    if isinstance(html_content, BeautifulSoup):
+        return html_content
+    return BeautifulSoup(html_content, HTML_PARSER, parse_only=_PAGE_STRAINER)
+
+
+def _comic_prefix(html_content: str) -> str:
+    """Cut a page just after its comic <picture>, or return it whole.
+    
+    The <head> meta tags and the comic image are all the extractors read, and
+    they come before the page's large script-heavy remainder, so parsing can
+    stop there. Pages without the comic <picture> are left untouched so the
+    og:image and <img> fallbacks still see everything.
+    """
+    marker = html_content.find('item-comic-image')
+    if marker == -1 or not html_content.startswith('<picture', html_content.rfind('<', 0, marker)):
+        return html_content
+    end = html_content.find('</picture>', marker)
+    return html_content if end == -1 else html_content[:end + len('</picture>')]
+
 
 class GoComicsScraper(BaseScraper):
     """Handles scraping comic pages from GoComics.
@@ -43,11 +89,14 @@ class GoComicsScraper(BaseScraper):
         super().__init__(base_url="https://www.gocomics.com")
         self.source_type = source_type
         self.driver = None
-        self.session = requests.Session()
-        # Standard request headers
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
+        # The WebDriver is shared, so concurrent fetches take turns on it
+        self._driver_lock = threading.Lock()
+        # Pooled session that already retries 429/5xx responses with backoff
+        self.http_client = ComicHTTPClient(self.base_url, max_retries=self.max_retries)
+        self.session = self.http_client.session
+        # How pages were served: 'http' fast path vs 'selenium' fallback
+        self.fetch_stats: Counter = Counter()
+        self._stats_lock = threading.Lock()
     
     def get_source_name(self) -> str:
         """Return the source name for this scraper."""
@@ -56,6 +105,10 @@ class GoComicsScraper(BaseScraper):
     def setup_driver(self):
         """Set up the Selenium WebDriver with Firefox in headless mode."""
         if not self.driver:
+            # Imported lazily; most runs never need a browser
+            from selenium import webdriver
+            from selenium.webdriver.firefox.options import Options
+            
             options = Options()
             options.add_argument('-headless')
             options.add_argument('--no-sandbox')
@@ -66,13 +119,39 @@ class GoComicsScraper(BaseScraper):
             
             self.driver = webdriver.Firefox(options=options)
             self.driver.set_window_size(1920, 1080)
+            # Hard cap so a hung page cannot stall a long-lived driver
+            self.driver.set_page_load_timeout(self.timeout)
             logger.info("Firefox WebDriver set up successfully")
     
     def close_driver(self):
         """Close the Selenium WebDriver."""
         if self.driver:
-            self.driver.quit()
-            self.driver = None
+            try:
+                self.driver.quit()
+            except Exception as e:
+                logger.debug(f"Error quitting WebDriver: {e}")
+            finally:
+                self.driver = None
+    
+    def __enter__(self) -> "GoComicsScraper":
+        """Share one WebDriver, started on first use, across scrapes until exit."""
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.log_fetch_stats()
+        self.close_driver()
+    
+    def _count_fetch(self, path: str) -> None:
+        with self._stats_lock:
+            self.fetch_stats[path] += 1
+    
+    def log_fetch_stats(self) -> None:
+        """Log how many pages the HTTP fast path served without a browser."""
+        http = self.fetch_stats['http']
+        selenium = self.fetch_stats['selenium']
+        if http + selenium:
+            logger.info(f"HTTP fast path served {http}/{http + selenium} pages "
+                        f"({http / (http + selenium):.0%}); {selenium} needed Selenium")
     
     def fetch_comic_page(self, comic_slug: str, date: str) -> Optional[str]:
         """Fetch a comic page from GoComics.
@@ -90,49 +169,114 @@ class GoComicsScraper(BaseScraper):
             # Try HTTP-only approach first (faster and more reliable)
             response = self.session.get(url, timeout=self.timeout)
             if response.status_code == 200:
-                return response.text
+                if _SERVER_RENDERED_RE.search(response.content):
+                    self._count_fetch('http')
+                    return response.text
+                logger.warning(f"No comic image in HTML for {url}")
+                self._count_fetch('selenium')
+                return self._fetch_with_selenium(url)
             elif response.status_code == 404:
                 logger.warning(f"Comic not found: {url}")
                 return None
             else:
                 logger.error(f"HTTP error {response.status_code} for {url}")
                 # Fall back to Selenium if HTTP fails
+                self._count_fetch('selenium')
                 return self._fetch_with_selenium(url)
         except Exception as e:
             logger.error(f"Error fetching {url}: {e}")
             # Fall back to Selenium
+            self._count_fetch('selenium')
             return self._fetch_with_selenium(url)
     
-    def _fetch_with_selenium(self, url: str) -> Optional[str]:
-        """Fetch a page using Selenium (fallback method)."""
-        try:
-            self.setup_driver()
-            logger.info(f"Fetching {url} with Selenium")
-            self.driver.get(url)
-            
-            # Wait for the comic content to load
-            wait = WebDriverWait(self.driver, 10)
-            wait.until(EC.presence_of_element_located((By.TAG_NAME, "picture")))
+    def fetch_comic_pages(self, comic_slug: str, dates: List[str],
+                          max_workers: int = MAX_FETCH_WORKERS) -> Dict[str, Optional[str]]:
+        """Fetch several dates of a comic concurrently over the shared session.
+        
+        Args:
+            comic_slug: The comic's slug (e.g., 'garfield')
+            dates: Dates in YYYY/MM/DD format
+            max_workers: Maximum number of pages fetched at once
             
-            return self.driver.page_source
-        except Exception as e:
-            logger.error(f"Selenium fetch failed for {url}: {e}")
-            return None
+        Returns:
+            A dict mapping each date to its HTML content, or None if fetching failed
+        """
+        pages: Dict[str, Optional[str]] = {}
+        if not dates:
+            return pages
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(dates))) as executor:
+            futures = {
+                executor.submit(self.fetch_comic_page, comic_slug, date): date
+                for date in dates
+            }
+            for future in as_completed(futures):
+                date = futures[future]
+                try:
+                    pages[date] = future.result()
+                except Exception as e:
+                    logger.error(f"Error fetching {comic_slug} on {date}: {e}")
+                    pages[date] = None
+        
+        return pages
     
-    def extract_images(self, html_content: str, comic_slug: str, date: str) -> List[Dict[str, str]]:
+    def _fetch_with_selenium(self, url: str) -> Optional[str]:
+        """Fetch a page using Selenium (fallback method).
+        
+        A WebDriver session that has died (crashed browser, invalid session
+        id) is replaced with a fresh driver and the page retried once.
+        """
+        from selenium.common.exceptions import TimeoutException, WebDriverException
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+        
+        with self._driver_lock:
+            for attempt in range(2):
+                try:
+                    self.setup_driver()
+                    logger.info(f"Fetching {url} with Selenium")
+                    self.driver.get(url)
+                    
+                    # Wait for the comic content to load; a short poll returns
+                    # soon after the <picture> appears
+                    wait = WebDriverWait(self.driver, 10, poll_frequency=0.25)
+                    wait.until(EC.presence_of_element_located((By.TAG_NAME, "picture")))
+                    
+                    html = self.driver.execute_script(_COMIC_MARKUP_JS)
+                    # The driver outlives this page; don't carry its session over
+                    self.driver.delete_all_cookies()
+                    return html
+                except TimeoutException as e:
+                    logger.error(f"Selenium fetch timed out for {url}: {e}")
+                    return None
+                except WebDriverException as e:
+                    self.close_driver()
+                    if attempt == 0:
+                        logger.warning(f"WebDriver session failed for {url}, restarting it: {e}")
+                        continue
+                    logger.error(f"Selenium fetch failed for {url}: {e}")
+                    return None
+                except Exception as e:
+                    # The browser session may be dead; start a fresh one next time
+                    logger.error(f"Selenium fetch failed for {url}: {e}")
+                    self.close_driver()
+                    return None
+    
+    def extract_images(self, html_content: Union[str, BeautifulSoup], comic_slug: str, date: str) -> List[Dict[str, str]]:
         """Extract comic images from GoComics HTML.
         
         GoComics typically has a single image per comic.
         
         Args:
-            html_content: The HTML content to parse
+            html_content: The HTML content to parse, or an already parsed soup
             comic_slug: The comic's slug
             date: The date string
             
         Returns:
             A list with a single image dictionary
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = _as_soup(html_content)
         images = []
         
         # Try to find the comic image using various methods
@@ -158,12 +302,12 @@ class GoComicsScraper(BaseScraper):
             })
             return images
         
-        # Method 3: Look for any img tag with the comic in the src
-        for img in soup.find_all('img'):
+        # Method 3: Look for any img tag with the comic in the src; only
+        # images served from the asset host are worth parsing.
+        for img in soup.find_all('img', src=_ASSET_SRC_RE):
             src = img.get('src', '')
             # Use proper URL parsing to check domain
             try:
-                from urllib.parse import urlparse
                 parsed = urlparse(src)
                 # Check hostname and path separately
                 if parsed.hostname == 'assets.amuniversal.com':
@@ -181,9 +325,9 @@ class GoComicsScraper(BaseScraper):
         logger.warning(f"No images found for {comic_slug} on {date}")
         return images
     
-    def extract_metadata(self, html_content: str, comic_slug: str, date: str) -> Dict[str, Any]:
-        """Extract metadata from the comic page."""
-        soup = BeautifulSoup(html_content, 'html.parser')
+    def extract_metadata(self, html_content: Union[str, BeautifulSoup], comic_slug: str, date: str) -> Dict[str, Any]:
+        """Extract metadata from the comic page (raw HTML or a parsed soup)."""
+        soup = _as_soup(html_content)
         
         metadata = {
             'title': '',
@@ -240,18 +384,55 @@ class GoComicsScraper(BaseScraper):
         if not html_content:
             return None
         
+        # Parse once, only as far as the comic, and share the tree between
+        # both extractors
+        soup = _as_soup(_comic_prefix(html_content))
+        
         # Extract images
-        images = self.extract_images(html_content, comic_slug, date)
+        images = self.extract_images(soup, comic_slug, date)
         if not images:
             logger.error(f"No images found for {comic_slug} on {date}")
             return None
         
         # Extract metadata
-        metadata = self.extract_metadata(html_content, comic_slug, date)
+        metadata = self.extract_metadata(soup, comic_slug, date)
         
         # Build standardized result
         return self.build_comic_result(comic_slug, date, images, metadata)
     
+    def scrape_many(self, jobs: List[Tuple[str, str]],
+                    max_workers: int = MAX_FETCH_WORKERS) -> Dict[Tuple[str, str], Optional[Dict[str, Any]]]:
+        """Scrape several comic/date pairs concurrently.
+        
+        Pages come over the shared HTTP session in parallel; the few that need
+        a browser take turns on the one WebDriver.
+        
+        Args:
+            jobs: (comic_slug, date) pairs, dates in YYYY/MM/DD format
+            max_workers: Maximum number of comics scraped at once
+            
+        Returns:
+            A dict mapping each (comic_slug, date) pair to its comic data, or None
+        """
+        results: Dict[Tuple[str, str], Optional[Dict[str, Any]]] = {}
+        if not jobs:
+            return results
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs))) as executor:
+            futures = {
+                executor.submit(self.scrape_comic, comic_slug, date): (comic_slug, date)
+                for comic_slug, date in jobs
+            }
+            for future in as_completed(futures):
+                job = futures[future]
+                try:
+                    results[job] = future.result()
+                except Exception as e:
+                    logger.error(f"Error scraping {job[0]} on {job[1]}: {e}")
+                    results[job] = None
+        
+        return results
+    
     def __del__(self):
         """Ensure driver is closed when object is destroyed."""
         self.close_driver()
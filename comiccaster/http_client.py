@@ -7,19 +7,24 @@ import logging
 from typing import Optional, Dict, Any
 import requests
 from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
 from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
+# Keep enough warm keep-alive connections for batch scrapes of many slugs
+DEFAULT_POOL_SIZE = 64
+
 
 class ComicHTTPClient:
     """Shared HTTP client with retry logic and common headers."""
     
-    def __init__(self, base_url: str = "https://www.gocomics.com", max_retries: int = 3):
+    def __init__(self, base_url: str = "https://www.gocomics.com", max_retries: int = 3,
+                 pool_size: int = DEFAULT_POOL_SIZE):
         self.base_url = base_url
-        self.session = self._create_session(max_retries)
+        self.session = self._create_session(max_retries, pool_size)
     
-    def _create_session(self, max_retries: int) -> requests.Session:
+    def _create_session(self, max_retries: int, pool_size: int = DEFAULT_POOL_SIZE) -> requests.Session:
         """Create a session with retry logic and common headers."""
         session = requests.Session()
         
@@ -28,7 +33,8 @@ class ComicHTTPClient:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
+            # Includes 'br' only when a Brotli decoder is installed
+            'Accept-Encoding': ACCEPT_ENCODING,
             'DNT': '1',
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1'
@@ -42,7 +48,11 @@ class ComicHTTPClient:
             backoff_factor=1
         )
         
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=retry_strategy
+        )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
         
@@ -1,69 +1,190 @@
 """
 Comics A-to-Z Loader Module
 
-Fetches the GoComics A-to-Z page with Selenium and parses the comic links out
-of its HTML.
+Fetches the GoComics A-to-Z page (over HTTP, falling back to Selenium) and
+parses the comic links out of its HTML.
 """
 
 import json
 import re
 import logging
-import time
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional, Tuple
 from pathlib import Path
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.by import By
-from selenium.common.exceptions import TimeoutException
+import lxml.html
+from lxml import etree
 from datetime import datetime
-from webdriver_manager.chrome import ChromeDriverManager
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+from .http_client import ComicHTTPClient
+
+# Parsed comics list files: path -> ((mtime_ns, size), comics). The web
+# interface and load_all_comics re-read the same files on every call.
+_JSON_CACHE: Dict[str, Tuple[Tuple[int, int], List[Dict[str, str]]]] = {}
+
+# orjson is an optional, faster codec for the comics list files.
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+# Library module: leave logging configuration to the application (see main()).
 logger = logging.getLogger(__name__)
 
+
+def _copy_comics(comics: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    """Shallow-copy each comic dict so callers can't modify the cached records."""
+    return [dict(comic) if isinstance(comic, dict) else comic for comic in comics]
+
+# Sources a comic config may declare; checked once per comic on every load.
+_VALID_SOURCES = ('gocomics-daily', 'gocomics-political', 'tinyview')
+_VALID_SOURCE_SET = frozenset(_VALID_SOURCES)
+
+# Compiled once; equivalent to the CSS selector "ol li a".
+_COMIC_LINK_XPATH = etree.XPath("//ol//li//a")
+
+# lxml rejects str input that carries an encoding declaration.
+_XML_DECLARATION_RE = re.compile(r'^\s*<\?xml[^>]*\?>')
+
+
+def _parse_html(html):
+    """Parse HTML (str or bytes) into an lxml tree, or return None if it cannot be parsed."""
+    if isinstance(html, str):
+        html = _XML_DECLARATION_RE.sub('', html, count=1)
+    if not html.strip():
+        return None
+    try:
+        return lxml.html.fromstring(html)
+    except (etree.ParserError, ValueError) as e:
+        logger.warning(f"Could not parse HTML: {e}")
+        return None
+
+# Writes debug dumps off the fetch path; its thread starts on first use and is
+# joined at interpreter exit, so a dump is never cut short.
+_DEBUG_IO_POOL = ThreadPoolExecutor(max_workers=1)
+
+# Concurrent HTTP fetches in fetch_pages; one pooled session serves them all.
+MAX_FETCH_WORKERS = 8
+
 class ComicsLoader:
     """Handles loading and parsing comic information from GoComics."""
     
-    def __init__(self, base_url: str = "https://www.gocomics.com"):
+    def __init__(self, base_url: str = "https://www.gocomics.com", links_settle_seconds: float = 0.5):
         """
         Initialize the ComicsLoader.
         
         Args:
             base_url (str): The base URL for GoComics. Defaults to "https://www.gocomics.com".
+            links_settle_seconds (float): How long the A-to-Z link count must hold
+                before the Selenium fetch treats the list as loaded. Defaults to 0.5.
         """
         self.base_url = base_url
+        self.links_settle_seconds = links_settle_seconds
         self.a_to_z_url = f"{base_url}/comics/a-to-z"
         self.comics_list = []
-        self.chrome_options = Options()
-        self.chrome_options.add_argument('--headless')
-        self.chrome_options.add_argument('--no-sandbox')
-        self.chrome_options.add_argument('--disable-dev-shm-usage')
-        
-        if 'CHROME_BIN' in os.environ:
-            self.chrome_options.binary_location = os.environ['CHROME_BIN']
+        self.http_client = ComicHTTPClient(base_url)
+        self.driver = None
+        # Inside a `with` block the driver is kept open between fetches.
+        self._reuse_driver = False
 
     def setup_driver(self):
         """Set up the Selenium WebDriver with Chrome in headless mode."""
+        # Selenium is only needed when the HTTP fetch falls short, so it's
+        # imported here rather than for every user of the comics lists.
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        from selenium.webdriver.chrome.service import Service
+
+        chrome_options = Options()
+        chrome_options.add_argument('--headless')
+        chrome_options.add_argument('--no-sandbox')
+        chrome_options.add_argument('--disable-dev-shm-usage')
+        # Return from get() at DOMContentLoaded; fetch_page waits for the list itself.
+        chrome_options.page_load_strategy = 'eager'
+        
+        # Only the link DOM is read, so don't download or render thumbnails,
+        # stylesheets or fonts.
+        chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.stylesheets": 2,
+            "profile.managed_default_content_settings.fonts": 2,
+        })
+        
+        if 'CHROME_BIN' in os.environ:
+            chrome_options.binary_location = os.environ['CHROME_BIN']
+
         if os.environ.get('USE_WEBDRIVER_MANAGER', 'false').lower() == 'true':
+            from webdriver_manager.chrome import ChromeDriverManager
+
             self.driver = webdriver.Chrome(
                 service=Service(ChromeDriverManager().install()),
-                options=self.chrome_options
+                options=chrome_options
             )
         else:
             service = Service()
             if 'CHROMEDRIVER_PATH' in os.environ:
                 service = Service(executable_path=os.environ['CHROMEDRIVER_PATH'])
-            self.driver = webdriver.Chrome(service=service, options=self.chrome_options)
+            self.driver = webdriver.Chrome(service=service, options=chrome_options)
             
         self.driver.set_window_size(1920, 1080)
+
+    def close_driver(self):
+        """Quit the Selenium WebDriver if one is running."""
+        if self.driver:
+            self.driver.quit()
+            self.driver = None
+
+    def __enter__(self) -> "ComicsLoader":
+        """Reuse one WebDriver, started on first use, for every fetch until exit."""
+        self._reuse_driver = True
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self._reuse_driver = False
+        self.close_driver()
+    
+    def fetch_page_http(self) -> Optional[str]:
+        """
+        Fetch the A-to-Z page with a plain HTTP request.
+        
+        Returns:
+            Optional[str]: The HTML content of the page, or None if the request
+            fails or the comics list isn't in the server-rendered HTML.
+        """
+        response = self.http_client.get(self.a_to_z_url)
+        if response is None:
+            return None
+        
+        # Parse the raw bytes so lxml honours any encoding declaration.
+        tree = _parse_html(response.content)
+        if tree is None or not _COMIC_LINK_XPATH(tree):
+            logger.info("Comics list not in the server HTML, needs a browser")
+            return None
+        return response.text
+    
+    def fetch_pages(self, urls: List[str], max_workers: int = MAX_FETCH_WORKERS) -> Dict[str, Optional[str]]:
+        """
+        Fetch several pages concurrently over plain HTTP.
+        
+        Args:
+            urls (List[str]): The page URLs to fetch.
+            max_workers (int): Maximum number of requests in flight at once.
+            
+        Returns:
+            Dict[str, Optional[str]]: Each URL mapped to its HTML content, or
+            None if that request failed.
+        """
+        if not urls:
+            return {}
+        
+        def fetch(url: str) -> Optional[str]:
+            response = self.http_client.get(url)
+            return response.text if response is not None else None
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+            return dict(zip(urls, executor.map(fetch, urls)))
     
     def fetch_page(self) -> Optional[str]:
         """
@@ -72,6 +193,11 @@ class ComicsLoader:
         Returns:
             Optional[str]: The HTML content of the page, or None if the request fails.
         """
+        from selenium.common.exceptions import TimeoutException
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+
         try:
             if not self.driver:
                 self.setup_driver()
@@ -79,16 +205,37 @@ class ComicsLoader:
             logger.info(f"Fetching {self.a_to_z_url}")
             self.driver.get(self.a_to_z_url)
 
-            # Wait for the comics list, then a bit longer for dynamic content.
-            wait = WebDriverWait(self.driver, 10)
+            # Wait for the comics list, then until scripts stop adding links to
+            # it (the count holds for links_settle_seconds, a couple of 0.25s
+            # polls by default) instead of sleeping.
+            wait = WebDriverWait(self.driver, 10, poll_frequency=0.25)
             wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "ol li a")))
-            time.sleep(2)
+            last_count, stable_since = None, 0.0
+
+            def links_settled(driver) -> bool:
+                nonlocal last_count, stable_since
+                count = len(driver.find_elements(By.CSS_SELECTOR, "ol li a"))
+                now = time.monotonic()
+                if count != last_count:
+                    last_count, stable_since = count, now
+                    return False
+                return now - stable_since >= self.links_settle_seconds
+
+            try:
+                wait.until(links_settled)
+            except TimeoutException:
+                # The list is on the page; take whatever has loaded so far.
+                logger.warning(f"Comics list still growing after 10s ({last_count} links); using it as is")
 
             html_content = self.driver.page_source
 
-            # Save the raw response for debugging
-            with open("debug_raw_response.html", "w", encoding="utf-8") as f:
-                f.write(html_content)
+            # Save the raw response for debugging; it's a multi-MB write,
+            # so only when debug logging is on, and in the background so
+            # parsing can start meanwhile.
+            if logger.isEnabledFor(logging.DEBUG):
+                _DEBUG_IO_POOL.submit(
+                    Path("debug_raw_response.html").write_text, html_content, encoding="utf-8"
+                )
             
             return html_content
             
@@ -99,9 +246,9 @@ class ComicsLoader:
             logger.error(f"Failed to fetch A-to-Z page: {e}")
             return None
         finally:
-            if self.driver:
-                self.driver.quit()
-                self.driver = None
+            # Outside a `with` block, don't leave a browser running.
+            if not self._reuse_driver:
+                self.close_driver()
     
     def parse_comic_title(self, text: str) -> Tuple[str, Optional[str], bool]:
         """
@@ -139,32 +286,21 @@ class ComicsLoader:
             ValueError: If the comics list cannot be found.
         """
         try:
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(html_text, 'html.parser')
-            comic_list = []
-            position = 1
-
-            for link in soup.select("ol li a"):
-                raw_title = link.text.strip()
-                url = link.get("href", "")
-
-                if raw_title and url:
-                    name, author, is_updated = self.parse_comic_title(raw_title)
-
-                    if url.startswith("/"):
-                        url = f"{self.base_url}{url}"
-
-                    slug = url.split("/")[-1]
-                    
-                    comic_list.append({
-                        "name": name,
-                        "author": author,
-                        "url": url,
-                        "slug": slug,
-                        "position": position,
-                        "is_updated": is_updated
-                    })
-                    position += 1
+            # lxml parses and runs the XPath in C; the A-to-Z page is large
+            # and only its list links are needed. A page lxml can't parse
+            # (blank or comment-only) has no links, so no comics.
+            tree = _parse_html(html_text)
+            links = _COMIC_LINK_XPATH(tree) if tree is not None else []
+            # Positions count only usable links (both text and an href).
+            titled_links = [
+                (title, url)
+                for title, url in ((link.text_content().strip(), link.get("href", "")) for link in links)
+                if title and url
+            ]
+            comic_list = [
+                self._comic_entry(position, title, url)
+                for position, (title, url) in enumerate(titled_links, start=1)
+            ]
             
             if not comic_list:
                 raise ValueError("No comics found in the page")
@@ -176,6 +312,21 @@ class ComicsLoader:
             logger.error(f"Unexpected error while extracting comics: {e}")
             raise
     
+    def _comic_entry(self, position: int, raw_title: str, url: str) -> Dict[str, str]:
+        """Build the comics list entry for one A-to-Z link."""
+        name, author, is_updated = self.parse_comic_title(raw_title)
+        if url[0] == "/":
+            url = self.base_url + url
+        return {
+            "name": name,
+            "author": author,
+            "url": url,
+            # Last path segment, without building the full split list.
+            "slug": url.rpartition("/")[2],
+            "position": position,
+            "is_updated": is_updated
+        }
+    
     def save_comics_list(self, comics: List[Dict[str, str]], output_file: str = "comics_list.json"):
         """
         Save the extracted comic information to a JSON file.
@@ -188,8 +339,13 @@ class ComicsLoader:
             output_path = Path(output_file)
             output_path.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(comics, f, indent=2, ensure_ascii=False)
+            # Both encoders write identical bytes: two-space indent, raw UTF-8.
+            if _orjson is not None:
+                data = _orjson.dumps(comics, option=_orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(comics, indent=2, ensure_ascii=False).encode('utf-8')
+            with open(output_path, 'wb') as f:
+                f.write(data)
             logger.info(f"Saved {len(comics)} comics to {output_file}")
         except Exception as e:
             logger.error(f"Failed to save comics list: {e}")
@@ -205,7 +361,8 @@ class ComicsLoader:
         Returns:
             List[Dict[str, str]]: List of comic information dictionaries.
         """
-        html_content = self.fetch_page()
+        # A plain GET is far cheaper than a browser; Selenium is the fallback.
+        html_content = self.fetch_page_http() or self.fetch_page()
         if not html_content:
             raise ValueError("Failed to fetch the A-to-Z page")
         
@@ -220,6 +377,9 @@ class ComicsLoader:
         """
         Load comic information from a JSON file.
         
+        Parsed files are cached until their mtime or size changes. Each call
+        returns fresh copies of the comic dicts, so callers may modify them.
+        
         Args:
             file_path (str): Path to the JSON file containing comic information.
             
@@ -231,10 +391,23 @@ class ComicsLoader:
             json.JSONDecodeError: If the file contains invalid JSON.
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                comics = json.load(f)
+            try:
+                st = os.stat(file_path)
+                stamp = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                stamp = None
+            cached = _JSON_CACHE.get(file_path)
+            if stamp is not None and cached is not None and cached[0] == stamp:
+                return _copy_comics(cached[1])
+
+            with open(file_path, 'rb') as f:
+                data = f.read()
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError.
+            comics = _orjson.loads(data) if _orjson is not None else json.loads(data)
+            if stamp is not None:
+                _JSON_CACHE[file_path] = (stamp, comics)
             logger.info(f"Loaded {len(comics)} comics from {file_path}")
-            return comics
+            return _copy_comics(comics)
         except FileNotFoundError:
             logger.error(f"Comics list file not found: {file_path}")
             raise
@@ -293,16 +466,13 @@ class ComicsLoader:
         Raises:
             ValueError: If the configuration is invalid.
         """
-        valid_sources = ['gocomics-daily', 'gocomics-political', 'tinyview']
-
-        required_fields = ['slug', 'name']
-        for field in required_fields:
+        for field in ('slug', 'name'):
             if field not in comic:
                 raise ValueError(f"Missing required field: {field}")
 
         source = comic.get('source', 'gocomics-daily')
-        if source not in valid_sources:
-            raise ValueError(f"Invalid source '{source}'. Valid sources: {valid_sources}")
+        if source not in _VALID_SOURCE_SET:
+            raise ValueError(f"Invalid source '{source}'. Valid sources: {list(_VALID_SOURCES)}")
         
         return True
     
@@ -323,9 +493,11 @@ class ComicsLoader:
         try:
             regular_comics = self.load_comics_from_file(regular_comics_file)
             for comic in regular_comics:
-                normalized = self.normalize_comic_config(comic)
-                self.validate_comic_config(normalized)
-                all_comics.append(normalized)
+                # Validating first is equivalent (a missing source defaults to a
+                # valid one) and lets comics that already declare a source skip
+                # normalize_comic_config's copy.
+                self.validate_comic_config(comic)
+                all_comics.append(comic if 'source' in comic else {**comic, 'source': 'gocomics-daily'})
             logger.info(f"Loaded {len(regular_comics)} regular comics")
         except FileNotFoundError:
             logger.warning(f"Regular comics file not found: {regular_comics_file}")
@@ -335,12 +507,11 @@ class ComicsLoader:
         try:
             political_comics = self.load_comics_from_file(political_comics_file)
             for comic in political_comics:
-                normalized = self.normalize_comic_config(comic)
                 # A political entry left at the default source is treated as political.
-                if normalized.get('source') == 'gocomics-daily':
-                    normalized['source'] = 'gocomics-political'
-                self.validate_comic_config(normalized)
-                all_comics.append(normalized)
+                if comic.get('source', 'gocomics-daily') == 'gocomics-daily':
+                    comic = {**comic, 'source': 'gocomics-political'}
+                self.validate_comic_config(comic)
+                all_comics.append(comic)
             logger.info(f"Loaded {len(political_comics)} political comics")
         except FileNotFoundError:
             logger.info(f"Political comics file not found: {political_comics_file}")
@@ -352,9 +523,13 @@ class ComicsLoader:
 
 def main():
     """Main function to demonstrate the ComicsLoader usage."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
     try:
-        loader = ComicsLoader()
-        comics = loader.load_comics()
+        with ComicsLoader() as loader:
+            comics = loader.load_comics()
         print(f"\nSuccessfully loaded {len(comics)} comics")
         
         # Print some sample comics
@@ -2,24 +2,75 @@
 The New Yorker Daily Cartoon Scraper Module
 
 Scrapes the New Yorker's Daily Cartoon for RSS feed generation.
-Uses requests + BeautifulSoup (no authentication required).
+Uses requests + lxml (no authentication required).
 Implements rate limiting to be respectful of the site.
 """
 
 import logging
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from urllib.parse import urljoin
 import requests
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
 import pytz
 
 from .base_scraper import BaseScraper
 
 logger = logging.getLogger(__name__)
 
+# Cartoon pages are fetched on a small pool so network latency overlaps the
+# rate-limit wait; REQUEST_DELAY still spaces out every request start.
+MAX_FETCH_WORKERS = 4
+
+# The extractors only need a handful of selectors, so they run as compiled
+# XPath over an lxml tree rather than walking a BeautifulSoup object graph.
+_CARTOON_LINK_XPATH = etree.XPath('//a[contains(@href, "/cartoons/daily-cartoon/")]')
+_CARTOON_IMG_XPATH = etree.XPath('//img[contains(@src, "media.newyorker.com/cartoons/")]')
+_TITLE_XPATH = etree.XPath('//title')
+# The first six <li> items whose first link points at /humor/; the filter and
+# the cap both run inside libxml2 so nav, footer and sidebar lists never reach
+# Python
+_HUMOR_LI_XPATH = etree.XPath('(//li[contains((.//a)[1]/@href, "/humor/")])[position() <= 6]')
+# Visible page text, skipping <script>/<style>/<template> like BS4's get_text()
+_PAGE_TEXT_XPATH = etree.XPath(
+    '//text()[not(ancestor::script or ancestor::style or ancestor::template)]'
+)
+
+# Caption is the quoted text just before "Cartoon by".
+# Handle both straight and curly quotes (U+201C / U+201D).
+_CAPTION_RE = re.compile(r'["\u201c\u201d]([^"\u201c\u201d]+)["\u201c\u201d](?=Cartoon by)')
+# How far before the first "Cartoon by" a caption may start
+_CAPTION_LOOKBEHIND = 500
+_ARTIST_RE = re.compile(r'Cartoon by ([A-Za-z\s\.]+?)(?:Copy|$|\n)')
+_TITLE_SUFFIX_RE = re.compile(r'\s*\|\s*The New Yorker$')
+# Date in the URL slug, e.g. /cartoons/daily-cartoon/friday-december-12th-a-i-slop
+_URL_DATE_RE = re.compile(r'(\w+)-(\w+)-(\d+)(?:st|nd|rd|th)')
+
+# The New Yorker dates cartoons in New York time
+_EASTERN = pytz.timezone('US/Eastern')
+
+_MONTHS = {
+    'january': 1, 'february': 2, 'march': 3, 'april': 4,
+    'may': 5, 'june': 6, 'july': 7, 'august': 8,
+    'september': 9, 'october': 10, 'november': 11, 'december': 12
+}
+
+
+def _parse_html(html: str):
+    """Parse HTML into an lxml tree, or return None if it cannot be parsed."""
+    if not html.strip():
+        return None
+    try:
+        return lxml.html.fromstring(html)
+    except (etree.ParserError, ValueError) as e:
+        logger.warning(f"Could not parse HTML: {e}")
+        return None
+
 
 class NewYorkerScraper(BaseScraper):
     """Scraper for The New Yorker Daily Cartoon."""
@@ -51,38 +102,59 @@ class NewYorkerScraper(BaseScraper):
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
         })
-        self.last_request_time = 0
+        # time.monotonic() of the latest reserved request slot
+        self.last_request_time = float('-inf')
+        self._rate_lock = threading.Lock()
+        # url -> (etag, last_modified, max_cartoons, cartoons) for conditional
+        # re-fetches of the listing page
+        self._etag_cache: Dict[str, Tuple[Optional[str], Optional[str], int, List[Dict[str, str]]]] = {}
     
     def get_source_name(self) -> str:
         """Return the source name for this scraper."""
         return 'newyorker'
     
     def _rate_limit(self):
-        """Enforce rate limiting between requests."""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.REQUEST_DELAY:
-            sleep_time = self.REQUEST_DELAY - elapsed
+        """Enforce rate limiting between requests.
+        
+        Thread-safe: each caller reserves the next request slot under the lock,
+        then sleeps outside it until that slot arrives.
+        """
+        with self._rate_lock:
+            now = time.monotonic()
+            sleep_time = self.last_request_time + self.REQUEST_DELAY - now
+            self.last_request_time = max(now, now + sleep_time)
+        if sleep_time > 0:
             logger.debug(f"Rate limiting: sleeping {sleep_time:.1f}s")
             time.sleep(sleep_time)
-        self.last_request_time = time.time()
     
-    def _fetch_page(self, url: str) -> Optional[str]:
-        """Fetch a page with retry logic and rate limiting.
+    def _absurl(self, href: str) -> str:
+        """Resolve an href against BASE_URL.
+        
+        Site-relative paths, nearly every link on these pages, are joined
+        directly; anything else goes through urljoin.
+        """
+        if href.startswith('/') and not href.startswith('//'):
+            return self.BASE_URL + href
+        return urljoin(self.BASE_URL, href)
+    
+    def _get(self, url: str, headers: Optional[Dict[str, str]] = None) -> Optional[requests.Response]:
+        """GET a URL with retry logic and rate limiting.
         
         Args:
             url: URL to fetch
+            headers: Extra request headers, e.g. conditional-request validators
             
         Returns:
-            HTML content as string, or None on failure
+            The successful response (including 304 Not Modified), or None on failure
         """
         self._rate_limit()
         
         for attempt in range(self.max_retries):
             try:
                 logger.debug(f"Fetching {url} (attempt {attempt + 1}/{self.max_retries})")
-                response = self.session.get(url, timeout=self.timeout)
+                response = self.session.get(url, timeout=self.timeout, headers=headers)
                 response.raise_for_status()
-                return response.text
+                return response
             except requests.RequestException as e:
                 logger.warning(f"Request failed (attempt {attempt + 1}/{self.max_retries}): {e}")
                 if attempt < self.max_retries - 1:
@@ -91,6 +163,18 @@ class NewYorkerScraper(BaseScraper):
         logger.error(f"Failed to fetch {url} after {self.max_retries} attempts")
         return None
     
+    def _fetch_page(self, url: str) -> Optional[str]:
+        """Fetch a page with retry logic and rate limiting.
+        
+        Args:
+            url: URL to fetch
+            
+        Returns:
+            HTML content as string, or None on failure
+        """
+        response = self._get(url)
+        return response.text if response is not None else None
+    
     def get_cartoon_list(self, max_cartoons: int = 15) -> List[Dict[str, str]]:
         """Fetch the list of recent cartoons from the listing page.
         
@@ -100,42 +184,77 @@ class NewYorkerScraper(BaseScraper):
         Returns:
             List of dicts with keys: title, url, date_str, author, thumbnail_url
         """
-        html = self._fetch_page(self.LISTING_URL)
+        # Revalidate a listing parsed earlier; it can answer this call only if
+        # it was built for at least as many cartoons or held all the page had.
+        headers = None
+        cached = self._etag_cache.get(self.LISTING_URL)
+        if cached:
+            etag, last_modified, cached_max, cached_cartoons = cached
+            if max_cartoons <= cached_max or len(cached_cartoons) < cached_max:
+                headers = {}
+                if etag:
+                    headers['If-None-Match'] = etag
+                if last_modified:
+                    headers['If-Modified-Since'] = last_modified
+        
+        response = self._get(self.LISTING_URL, headers=headers)
+        if response is not None and response.status_code == 304 and headers:
+            logger.info("Cartoon listing not modified; reusing parsed listing")
+            return [dict(cartoon) for cartoon in cached_cartoons[:max_cartoons]]
+        
+        html = response.text if response is not None else None
         if not html:
             logger.error("Failed to fetch cartoon listing page")
             return []
         
-        soup = BeautifulSoup(html, 'html.parser')
+        tree = _parse_html(html)
+        if tree is None:
+            logger.error("Failed to parse cartoon listing page")
+            return []
         cartoons = []
         
-        # Cartoon links follow the pattern /cartoons/daily-cartoon/...
+        # Cartoon links follow the pattern /cartoons/daily-cartoon/...; the
+        # XPath filter on that trailing slash already excludes the listing
+        # page's own /cartoons/daily-cartoon link.
+        seen_hrefs = set()
         seen_urls = set()
 
-        for link in soup.find_all('a', href=True):
+        for link in _CARTOON_LINK_XPATH(tree):
             href = link.get('href', '')
 
-            # Match individual cartoon URLs, but not the listing page itself
-            if '/cartoons/daily-cartoon/' in href and href != '/cartoons/daily-cartoon':
-                full_url = urljoin(self.BASE_URL, href)
-                
-                # Skip duplicates
-                if full_url in seen_urls:
-                    continue
-                seen_urls.add(full_url)
-                
-                title = link.get_text(strip=True)
+            # Listings repeat each link several times; drop repeats before
+            # paying for urljoin
+            if href in seen_hrefs:
+                continue
+            seen_hrefs.add(href)
 
-                # Skip empty titles or generic navigation links
-                if not title or len(title) < 10:
-                    continue
-                
-                cartoons.append({
-                    'title': title,
-                    'url': full_url,
-                })
-                
-                if len(cartoons) >= max_cartoons:
-                    break
+            full_url = self._absurl(href)
+            
+            # Skip duplicates (relative and absolute forms of one URL)
+            if full_url in seen_urls:
+                continue
+            seen_urls.add(full_url)
+            
+            title = ''.join(text.strip() for text in link.itertext())
+
+            # Skip empty titles or generic navigation links
+            if not title or len(title) < 10:
+                continue
+            
+            cartoons.append({
+                'title': title,
+                'url': full_url,
+            })
+            
+            if len(cartoons) >= max_cartoons:
+                break
+        
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if etag or last_modified:
+            self._etag_cache[self.LISTING_URL] = (
+                etag, last_modified, max_cartoons, [dict(cartoon) for cartoon in cartoons]
+            )
         
         logger.info(f"Found {len(cartoons)} cartoons on listing page")
         return cartoons
@@ -153,79 +272,79 @@ class NewYorkerScraper(BaseScraper):
         if not html:
             return None
         
-        soup = BeautifulSoup(html, 'html.parser')
+        tree = _parse_html(html)
+        if tree is None:
+            return None
         result = {
             'url': url,
             'source': 'newyorker',
         }
         
-        # Prefer the high-res master image
+        # Prefer the high-res master image, falling back to the first cartoon
+        # image; one lazy walk that stops as soon as the master turns up.
         img_tag = None
-        for img in soup.find_all('img'):
+        fallback = None
+        for img in tree.iter('img'):
             src = img.get('src', '')
-            if 'media.newyorker.com/cartoons/' in src and 'master' in src:
+            if 'media.newyorker.com/cartoons/' not in src:
+                continue
+            if 'master' in src:
                 img_tag = img
                 break
-
-        if not img_tag:
-            # Fallback: any cartoon image
-            for img in soup.find_all('img'):
-                src = img.get('src', '')
-                if 'media.newyorker.com/cartoons/' in src:
-                    img_tag = img
-                    break
-        
-        if img_tag:
+            if fallback is None:
+                fallback = img
+        if img_tag is None:
+            img_tag = fallback
+        
+        if img_tag is not None:
             result['image_url'] = img_tag.get('src', '')
             result['image_alt'] = img_tag.get('alt', '')
         else:
             logger.warning(f"No cartoon image found on {url}")
             return None
         
-        # Caption is the quoted text just before "Cartoon by".
-        # Handle both straight and curly quotes (U+201C / U+201D).
+        # Caption and artist both sit around "Cartoon by", so the regexes only
+        # scan from just before its first occurrence rather than the nav and
+        # header chrome that leads the page.
         caption = None
-        page_text = soup.get_text()
-        caption_match = re.search(r'["\u201c\u201d]([^"\u201c\u201d]+)["\u201c\u201d](?=Cartoon by)', page_text)
-        if caption_match:
-            caption = f'"{caption_match.group(1)}"'
+        artist = None
+        page_text = ''.join(_PAGE_TEXT_XPATH(tree))
+        byline_idx = page_text.find('Cartoon by')
+        if byline_idx != -1:
+            byline_text = page_text[max(0, byline_idx - _CAPTION_LOOKBEHIND):]
+            
+            # Caption is the quoted text just before "Cartoon by"
+            caption_match = _CAPTION_RE.search(byline_text)
+            if caption_match:
+                caption = f'"{caption_match.group(1)}"'
+            
+            # Artist name follows the "Cartoon by X" pattern
+            artist_match = _ARTIST_RE.search(byline_text)
+            if artist_match:
+                artist = artist_match.group(1).strip()
         
         result['caption'] = caption or ''
         
-        # Artist name follows the "Cartoon by X" pattern
-        artist = None
-        page_text = soup.get_text()
-        artist_match = re.search(r'Cartoon by ([A-Za-z\s\.]+?)(?:Copy|$|\n)', page_text)
-        if artist_match:
-            artist = artist_match.group(1).strip()
-        
         result['author'] = artist or 'The New Yorker'
         
         # Extract title from the page <title>, dropping the site suffix
-        title_tag = soup.find('title')
-        if title_tag:
-            title = title_tag.get_text(strip=True)
-            title = re.sub(r'\s*\|\s*The New Yorker$', '', title)
+        title_tags = _TITLE_XPATH(tree)
+        if title_tags:
+            title = title_tags[0].text_content().strip()
+            title = _TITLE_SUFFIX_RE.sub('', title)
             result['title'] = title
         else:
             result['title'] = 'Daily Cartoon'
         
-        # Extract date from the URL slug, e.g.
-        # /cartoons/daily-cartoon/friday-december-12th-a-i-slop
-        date_match = re.search(r'(\w+)-(\w+)-(\d+)(?:st|nd|rd|th)', url)
+        # Extract date from the URL slug
+        date_match = _URL_DATE_RE.search(url)
         if date_match:
             try:
                 day_name, month_str, day = date_match.groups()
-                month_map = {
-                    'january': 1, 'february': 2, 'march': 3, 'april': 4,
-                    'may': 5, 'june': 6, 'july': 7, 'august': 8,
-                    'september': 9, 'october': 10, 'november': 11, 'december': 12
-                }
-                month = month_map.get(month_str.lower())
+                month = _MONTHS.get(month_str.lower())
                 if month:
                     # Assume current year; if the month is well ahead, it's last year
-                    eastern = pytz.timezone('US/Eastern')
-                    now = datetime.now(eastern)
+                    now = datetime.now(_EASTERN)
                     year = now.year
                     if month > now.month + 1:
                         year -= 1
@@ -235,22 +354,17 @@ class NewYorkerScraper(BaseScraper):
         
         if 'date' not in result:
             # Fall back to today's date
-            eastern = pytz.timezone('US/Eastern')
-            result['date'] = datetime.now(eastern).strftime('%Y-%m-%d')
+            result['date'] = datetime.now(_EASTERN).strftime('%Y-%m-%d')
         
         # Extract "More Humor and Cartoons" links with full text
         humor_links = []
-        for li in soup.find_all('li'):
-            link = li.find('a')
-            if link and '/humor/' in link.get('href', ''):
-                full_text = ' '.join(li.get_text().split())  # normalize whitespace
-                href = link.get('href', '')
-                humor_links.append({
-                    'title': full_text,
-                    'url': urljoin(self.BASE_URL, href)
-                })
-                if len(humor_links) >= 6:
-                    break
+        for li in _HUMOR_LI_XPATH(tree):
+            full_text = ' '.join(li.text_content().split())  # normalize whitespace
+            href = li.find('.//a').get('href', '')
+            humor_links.append({
+                'title': full_text,
+                'url': self._absurl(href)
+            })
         
         result['humor_links'] = humor_links
         
@@ -271,11 +385,11 @@ class NewYorkerScraper(BaseScraper):
         """
         cartoons = self.get_cartoon_list(max_cartoons=15)
         
-        detailed_cartoons = []
-        for cartoon in cartoons:
-            details = self.scrape_cartoon_page(cartoon['url'])
-            if details:
-                detailed_cartoons.append(details)
+        # map() keeps listing order, so the feed order is unchanged
+        with ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as executor:
+            pages = executor.map(self.scrape_cartoon_page,
+                                 [cartoon['url'] for cartoon in cartoons])
+            detailed_cartoons = [details for details in pages if details]
         
         return {
             'cartoons': detailed_cartoons,
@@ -297,15 +411,11 @@ class NewYorkerScraper(BaseScraper):
         Returns:
             List of image dictionaries with url and alt keys
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
-        images = []
-        
-        for img in soup.find_all('img'):
-            src = img.get('src', '')
-            if 'media.newyorker.com/cartoons/' in src:
-                images.append({
-                    'url': src,
-                    'alt': img.get('alt', 'New Yorker Cartoon')
-                })
+        tree = _parse_html(html_content)
+        if tree is None:
+            return []
         
-        return images
+        return [
+            {'url': img.get('src'), 'alt': img.get('alt', 'New Yorker Cartoon')}
+            for img in _CARTOON_IMG_XPATH(tree)
+        ]
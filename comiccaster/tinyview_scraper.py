@@ -274,9 +274,6 @@ class TinyviewScraper(BaseScraper):
                 
                 self.driver.get(strip_url)
                 
-                # Wait for the strip page to load initially
-                time.sleep(2)
-                
                 # Wait for panels, which load via JavaScript.
                 try:
                     # Wait up to 5 seconds for the first comic image to appear.
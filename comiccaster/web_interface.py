@@ -9,6 +9,7 @@ This module provides a web interface for users to:
 
 import os
 import json
+import logging
 import uuid
 import re
 import requests
@@ -21,7 +22,7 @@ from werkzeug.utils import secure_filename
 # Import our existing modules
 from comiccaster.loader import ComicsLoader
 from comiccaster.scraper import ComicScraper
-from comiccaster.feed_generator import ComicFeedGenerator
+from comiccaster.feed_generator import ComicFeedGenerator, read_feed_etag
 
 app = Flask(__name__)
 app.secret_key = os.environ.get('SECRET_KEY', 'dev-key-for-testing')
@@ -76,13 +77,29 @@ def individual_feed(comic_slug):
     if not feed_path.exists():
         return f"Feed for {safe_slug} not found", 404
     
+    # The feed generator keeps an ETag and last-modified time beside each feed;
+    # answer a matching conditional request without reading the feed at all.
+    # The ETag ignores lastBuildDate, so it is served as a weak validator.
+    etag = read_feed_etag(feed_path)
+    if etag and request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+        response.set_etag(etag, weak=True)
+        return response
+
     # Serve the XML file with the correct content type
     try:
         with open(feed_path, 'r') as f:
-            return Response(f.read(), mimetype='application/xml')
+            response = Response(f.read(), mimetype='application/xml')
     except Exception:
         return "Error reading feed", 500
 
+    if etag:
+        response.set_etag(etag, weak=True)
+        lastmod_path = feed_path.with_name(f'{feed_path.name}.lastmod')
+        if lastmod_path.exists():
+            response.headers['Last-Modified'] = lastmod_path.read_text().strip()
+    return response
+
 @app.route('/feed/<token>')
 def access_feed(token):
     """Access a previously generated feed by token (for backwards compatibility)."""
@@ -234,6 +251,10 @@ def generate_opml_file():
         return redirect(url_for('index'))
 
 if __name__ == '__main__':
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
     # Only enable debug mode if explicitly set in environment
     debug = os.environ.get('FLASK_DEBUG', 'False').lower() in ['true', '1', 'yes']
     app.run(debug=debug) 
\ No newline at end of file
@@ -9,6 +9,7 @@ This script:
 """
 
 import json
+import logging
 import sys
 import html
 import re
@@ -23,6 +24,13 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from comiccaster.feed_generator import ComicFeedGenerator
 
+# The feed generator logs per-feed progress and errors; show them alongside
+# this script's own output.
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+)
+
 
 def extract_live_comicskingdom_entries(comic_info: Dict, limit: int = 30) -> List[Dict]:
     """Fetch live entries for a Comics Kingdom comic from page bootstrap JSON."""
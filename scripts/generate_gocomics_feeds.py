@@ -16,7 +16,7 @@ import logging
 import sys
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 import pytz
 
@@ -127,9 +127,12 @@ def generate_feed_for_comic(
     comic_info: Dict,
     scraped_data: Dict[str, List[Dict]],
     generator: ComicFeedGenerator,
+    updated_time: Optional[datetime] = None,
 ) -> bool:
     """Generate a feed for a single comic from scraped data.
 
+    updated_time is the feed's lastBuildDate, shared across one build run.
+
     Returns True if feed was generated, False if no data available.
     """
     slug = comic_info['slug']
@@ -177,7 +180,7 @@ def generate_feed_for_comic(
     entries.sort(key=lambda x: x['pub_date'])
 
     try:
-        return generator.generate_feed(comic_info, entries)
+        return generator.generate_feed(comic_info, entries, updated_time=updated_time)
     except Exception as e:
         logger.error(f"Error generating feed for {comic_info['name']}: {e}")
         return False
@@ -205,9 +208,10 @@ def main():
 
     successful = 0
     skipped = 0
+    build_time = datetime.now(pytz.UTC)
 
     for comic in catalog:
-        if generate_feed_for_comic(comic, scraped_data, generator):
+        if generate_feed_for_comic(comic, scraped_data, generator, build_time):
             successful += 1
         else:
             skipped += 1
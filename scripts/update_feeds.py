@@ -8,6 +8,7 @@ import json
 import os
 import logging
 import sys
+from calendar import timegm
 from datetime import datetime, timedelta, timezone
 import pytz
 import requests
@@ -19,7 +20,6 @@ import feedparser
 import configparser
 import random
 import re
-import time
 from pathlib import Path
 from typing import Dict, List, Optional, Union
 import yaml
@@ -456,10 +456,8 @@ def regenerate_feed(comic_info: Dict[str, str], new_entries: List[Dict[str, any]
                     # Extract necessary data and ensure timezone-aware date
                     pub_date = datetime.now(pytz.UTC) # Default fallback
                     if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                         # feedparser gives time.struct_time, convert to datetime
-                         ts = time.mktime(entry.published_parsed)
-                         naive_dt = datetime.fromtimestamp(ts)
-                         pub_date = pytz.UTC.localize(naive_dt) # Assume UTC if no timezone
+                         # feedparser gives a UTC time.struct_time; timegm keeps it in UTC
+                         pub_date = datetime.fromtimestamp(timegm(entry.published_parsed), tz=timezone.utc)
                     elif hasattr(entry, 'published'):
                          # Try parsing the published string
                          try:
@@ -556,7 +554,7 @@ def regenerate_feed(comic_info: Dict[str, str], new_entries: List[Dict[str, any]
 
     # 4. Generate the feed using ComicFeedGenerator
     logger.info(f"Generating final feed with {len(sorted_entries)} entries.")
-    success = generator.generate_feed(comic_info, sorted_entries)
+    success = generator.generate_feed(comic_info, sorted_entries, max_entries=max_feed_entries)
 
     if success:
         logger.info(f"Successfully regenerated feed for {comic_info['name']} at {feed_path}")
@@ -7,8 +7,10 @@ setup(
     install_requires=[
         "feedgen>=0.9.0",
         "flask>=3.1.3",
+        "Jinja2>=3.1.2",
         "requests>=2.32.0",
         "beautifulsoup4>=4.9.0",
+        "lxml>=4.9.0",
         "pytz>=2021.1",
         "selenium>=4.0.0",
         "feedparser>=6.0.11",
@@ -24,6 +26,10 @@ setup(
             "pytest-mock>=3.6.0",
             "requests-mock>=1.11.0",
         ],
+        "speedups": [
+            "orjson>=3.9.0",
+            "brotli>=1.2.0",
+        ],
     },
     python_requires=">=3.10",
 ) 
\ No newline at end of file
@@ -180,4 +180,289 @@ class TestComicConfiguration:
             assert comics[0]['source'] == 'gocomics-daily'  # Default
             assert comics[1]['source'] == 'gocomics-daily'
             assert comics[2]['source'] == 'gocomics-political'
-            assert comics[3]['source'] == 'tinyview'
\ No newline at end of file
+            assert comics[3]['source'] == 'tinyview'
+
+class TestExtractComicsFromSource:
+    """Test parsing the A-to-Z page HTML."""
+
+    def test_extracts_list_links_in_order(self):
+        from comiccaster.loader import ComicsLoader
+
+        html = '''
+        <nav><a href="/about">About</a></nav>
+        <ol>
+          <li><a href="/garfield"><span>Garfield</span> By Jim Davis</a></li>
+          <li><div><a href="https://www.gocomics.com/peanuts">Peanuts By Charles Schulz Updated</a></div></li>
+          <li><a href="">No link</a></li>
+        </ol>
+        '''
+        comics = ComicsLoader().extract_comics_from_source(html)
+
+        assert [(c['slug'], c['name'], c['author'], c['position'], c['is_updated']) for c in comics] == [
+            ('garfield', 'Garfield', 'Jim Davis', 1, False),
+            ('peanuts', 'Peanuts', 'Charles Schulz', 2, True),
+        ]
+        assert comics[0]['url'] == 'https://www.gocomics.com/garfield'
+
+    @pytest.mark.parametrize('html', ['', '<!-- down for maintenance -->'])
+    def test_empty_page_raises(self, html):
+        from comiccaster.loader import ComicsLoader
+
+        with pytest.raises(ValueError, match='No comics found'):
+            ComicsLoader().extract_comics_from_source(html)
+
+    def test_parses_page_with_encoding_declaration(self):
+        from comiccaster.loader import ComicsLoader
+
+        html = '<?xml version="1.0" encoding="utf-8"?><ol><li><a href="/garfield">Garfield</a></li></ol>'
+        comics = ComicsLoader().extract_comics_from_source(html)
+
+        assert [c['slug'] for c in comics] == ['garfield']
+
+
+class TestComicsLoaderDriver:
+    """Test WebDriver lifetime across fetches."""
+
+    def _loader(self, drivers):
+        from comiccaster.loader import ComicsLoader
+
+        # Settle after a single unchanged poll; _fetch_with_counts covers the window.
+        loader = ComicsLoader(links_settle_seconds=0)
+
+        def setup_driver():
+            driver = Mock(page_source='<ol><li><a href="/garfield">Garfield</a></li></ol>')
+            driver.find_elements.return_value = [Mock()] * 3
+            drivers.append(driver)
+            loader.driver = driver
+
+        loader.setup_driver = setup_driver
+        return loader
+
+    def _fetch_with_counts(self, counts, polls=40):
+        """Run fetch_page with the link count following `counts`, on a fake 0.25s-per-poll clock."""
+        import comiccaster.loader as loader_module
+        from selenium.common.exceptions import TimeoutException
+
+        drivers = []
+        loader = self._loader(drivers)
+        loader.links_settle_seconds = 0.5
+        loader.setup_driver()
+        counts = iter(counts)
+        drivers[0].find_elements.side_effect = lambda *args: [Mock()] * next(counts)
+        clock = [0.0]
+
+        def until(condition):
+            for _ in range(polls):
+                result = condition(drivers[0])
+                if result:
+                    return result
+                clock[0] += 0.25
+            raise TimeoutException()
+
+        with patch('selenium.webdriver.support.ui.WebDriverWait') as mock_wait, \
+             patch.object(loader_module, 'time', Mock(monotonic=lambda: clock[0])):
+            mock_wait.return_value.until.side_effect = until
+            html = loader.fetch_page()
+        mock_wait.assert_called_with(drivers[0], 10, poll_frequency=0.25)
+        return html, drivers[0]
+
+    def test_fetch_waits_for_link_count_to_hold(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        # A one-poll pause in the growth doesn't end the wait; 4 links must hold for 0.5s.
+        html, driver = self._fetch_with_counts([1, 1, 2, 2, 4, 4, 4, 4])
+
+        assert html == driver.page_source
+        assert driver.find_elements.call_count == 7
+
+    def test_fetch_uses_partial_list_when_count_never_settles(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        html, driver = self._fetch_with_counts(range(1, 100))
+
+        assert html == driver.page_source
+        assert driver.find_elements.call_count == 40
+
+    def test_setup_driver_blocks_page_assets(self, monkeypatch):
+        from comiccaster.loader import ComicsLoader
+
+        monkeypatch.delenv('USE_WEBDRIVER_MANAGER', raising=False)
+        with patch('selenium.webdriver.Chrome') as mock_chrome, \
+             patch('selenium.webdriver.chrome.service.Service'):
+            ComicsLoader().setup_driver()
+
+        options = mock_chrome.call_args.kwargs['options']
+        assert options.page_load_strategy == 'eager'
+        assert '--blink-settings=imagesEnabled=false' in options.arguments
+        assert options.experimental_options['prefs']['profile.managed_default_content_settings.images'] == 2
+
+    def test_context_manager_reuses_driver(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        drivers = []
+        with self._loader(drivers) as loader:
+            assert loader.fetch_page()
+            assert loader.fetch_page()
+
+        assert len(drivers) == 1
+        drivers[0].quit.assert_called_once()
+        assert loader.driver is None
+
+    def test_fetch_dumps_html_only_when_debugging(self, tmp_path, monkeypatch, caplog):
+        import logging
+        from comiccaster.loader import _DEBUG_IO_POOL
+
+        monkeypatch.chdir(tmp_path)
+        loader = self._loader([])
+        assert loader.fetch_page()
+        assert not (tmp_path / 'debug_raw_response.html').exists()
+
+        caplog.set_level(logging.DEBUG, logger='comiccaster.loader')
+        html = loader.fetch_page()
+        _DEBUG_IO_POOL.submit(lambda: None).result()  # wait for the queued dump
+        assert (tmp_path / 'debug_raw_response.html').read_text() == html
+
+    def test_fetch_without_context_quits_driver(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        drivers = []
+        loader = self._loader(drivers)
+        assert loader.fetch_page()
+
+        drivers[0].quit.assert_called_once()
+        assert loader.driver is None
+
+    def test_load_comics_skips_selenium_when_http_has_list(self):
+        drivers = []
+        loader = self._loader(drivers)
+        html = '<?xml version="1.0" encoding="utf-8"?><ol><li><a href="/garfield">Garfield</a></li></ol>'
+        response = Mock(text=html, content=html.encode('utf-8'))
+        with patch.object(loader.http_client, 'get', return_value=response):
+            comics = loader.load_comics(save_to_file=False)
+
+        assert [comic['slug'] for comic in comics] == ['garfield']
+        assert drivers == []
+
+    def test_load_comics_falls_back_to_selenium(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        drivers = []
+        loader = self._loader(drivers)
+        response = Mock(text='<div id="app"></div>', content=b'<div id="app"></div>')
+        with patch.object(loader.http_client, 'get', return_value=response):
+            comics = loader.load_comics(save_to_file=False)
+
+        assert [comic['slug'] for comic in comics] == ['garfield']
+        assert len(drivers) == 1
+
+    @pytest.mark.parametrize('html', [
+        '<?xml version="1.0" encoding="utf-8"?><html><body><p>Back soon</p></body></html>',
+        '<!-- down for maintenance -->',
+    ])
+    def test_load_comics_falls_back_to_selenium_on_unparseable_http_page(self, html):
+        loader = self._loader([])
+        response = Mock(text=html, content=html.encode('utf-8'))
+        with patch.object(loader.http_client, 'get', return_value=response), \
+             patch.object(loader, 'fetch_page',
+                          return_value='<ol><li><a href="/garfield">Garfield</a></li></ol>') as fetch_page:
+            comics = loader.load_comics(save_to_file=False)
+
+        fetch_page.assert_called_once()
+        assert [comic['slug'] for comic in comics] == ['garfield']
+
+
+class TestComicsLoaderFetchPages:
+    """Test concurrent HTTP page fetches."""
+
+    def test_maps_each_url_to_its_html(self):
+        from comiccaster.loader import ComicsLoader
+
+        loader = ComicsLoader()
+        urls = [f'https://www.gocomics.com/page/{i}' for i in range(5)]
+
+        def fake_get(url):
+            return None if url.endswith('/3') else Mock(text=f'<html>{url}</html>')
+
+        with patch.object(loader.http_client, 'get', side_effect=fake_get):
+            pages = loader.fetch_pages(urls)
+
+        assert pages == {url: (None if url.endswith('/3') else f'<html>{url}</html>') for url in urls}
+        assert loader.fetch_pages([]) == {}
+
+
+class TestComicsListFiles:
+    """Test the comics list JSON round trip."""
+
+    @pytest.mark.parametrize('use_orjson', [True, False])
+    def test_save_and_load_round_trip(self, tmp_path, use_orjson):
+        import comiccaster.loader
+        from comiccaster.loader import ComicsLoader
+
+        if use_orjson and comiccaster.loader._orjson is None:
+            pytest.skip('orjson not installed')
+        comics = [{'slug': 'olafo', 'name': 'El Pequeño Mundo', 'author': None, 'position': 1}]
+        output = tmp_path / 'comics_list.json'
+
+        with patch.object(comiccaster.loader, '_orjson', comiccaster.loader._orjson if use_orjson else None):
+            ComicsLoader().save_comics_list(comics, str(output))
+            assert ComicsLoader().load_comics_from_file(str(output)) == comics
+
+        assert output.read_bytes() == json.dumps(comics, indent=2, ensure_ascii=False).encode('utf-8')
+
+    def test_load_reuses_parsed_file_until_it_changes(self, tmp_path):
+        import os
+        from comiccaster.loader import ComicsLoader
+
+        path = tmp_path / 'comics_list.json'
+        path.write_text(json.dumps([{'slug': 'garfield', 'name': 'Garfield'}]))
+        loader = ComicsLoader()
+
+        first = loader.load_comics_from_file(str(path))
+        with patch('builtins.open') as mock_file:
+            assert loader.load_comics_from_file(str(path)) == first
+            mock_file.assert_not_called()
+
+        path.write_text(json.dumps([{'slug': 'peanuts', 'name': 'Peanuts'}, {'slug': 'x', 'name': 'X'}]))
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        assert [comic['slug'] for comic in loader.load_comics_from_file(str(path))] == ['peanuts', 'x']
+
+    def test_mutating_loaded_comics_does_not_touch_cache(self, tmp_path):
+        from comiccaster.loader import ComicsLoader
+
+        path = tmp_path / 'comics_list.json'
+        path.write_text(json.dumps([{'slug': 'garfield', 'name': 'Garfield', 'source': 'gocomics-daily'}]))
+        loader = ComicsLoader()
+
+        loader.load_comics_from_file(str(path))[0]['name'] = 'Changed'
+        loader.load_comics_from_file(str(path))[0]['name'] = 'Changed again'
+        loader.load_all_comics(str(path), str(tmp_path / 'missing.json'))[0]['source'] = 'tinyview'
+
+        assert loader.load_comics_from_file(str(path)) == [
+            {'slug': 'garfield', 'name': 'Garfield', 'source': 'gocomics-daily'}
+        ]
+
+
+class TestLoadAllComics:
+    """Test merging the regular and political comics lists."""
+
+    def test_defaults_sources_without_touching_loaded_dicts(self, tmp_path):
+        from comiccaster.loader import ComicsLoader
+
+        regular = tmp_path / 'comics_list.json'
+        regular.write_text(json.dumps([
+            {'slug': 'garfield', 'name': 'Garfield'},
+            {'slug': 'nick-anderson', 'name': 'Nick Anderson', 'source': 'tinyview'},
+        ]))
+        political = tmp_path / 'political_comics_list.json'
+        political.write_text(json.dumps([
+            {'slug': 'doonesbury', 'name': 'Doonesbury', 'source': 'gocomics-daily'},
+            {'slug': 'clay-bennett', 'name': 'Clay Bennett'},
+        ]))
+        loader = ComicsLoader()
+
+        comics = loader.load_all_comics(str(regular), str(political))
+
+        assert [(c['slug'], c['source']) for c in comics] == [
+            ('garfield', 'gocomics-daily'),
+            ('nick-anderson', 'tinyview'),
+            ('doonesbury', 'gocomics-political'),
+            ('clay-bennett', 'gocomics-political'),
+        ]
+        assert loader.load_comics_from_file(str(regular))[0] == {'slug': 'garfield', 'name': 'Garfield'}
+        assert loader.load_comics_from_file(str(political))[0]['source'] == 'gocomics-daily'
@@ -2,6 +2,7 @@
 
 import pytest
 import os
+import time
 from datetime import datetime
 import pytz
 from unittest.mock import patch, mock_open, MagicMock
@@ -56,7 +57,7 @@ def test_load_feed_entries(mock_parse, mock_exists, feed_aggregator, mock_feed_c
     mock_entry.title = 'Test Comic Strip'
     mock_entry.link = 'http://example.com/comic/1'
     mock_entry.description = 'A funny test comic'
-    mock_entry.published_parsed.timestamp.return_value = datetime(2024, 1, 1, 12, 0, tzinfo=pytz.UTC).timestamp()
+    mock_entry.published_parsed = time.gmtime(datetime(2024, 1, 1, 12, 0, tzinfo=pytz.UTC).timestamp())
     
     mock_feed = MagicMock()
     mock_feed.entries = [mock_entry]
@@ -68,7 +69,7 @@ def test_load_feed_entries(mock_parse, mock_exists, feed_aggregator, mock_feed_c
     assert entry['title'] == 'Test Comic Strip'
     assert entry['link'] == 'http://example.com/comic/1'
     assert entry['description'] == 'A funny test comic'
-    assert isinstance(entry['published'], datetime)
+    assert entry['published'] == datetime(2024, 1, 1, 12, 0, tzinfo=pytz.UTC)
     assert entry['comic'] == 'test-comic'
 
 def test_load_feed_entries_nonexistent_file(feed_aggregator):
@@ -1,12 +1,15 @@
 """Tests for the ComicFeedGenerator class."""
 
+import json
+import os
+import re
 import pytest
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 from feedgen.feed import FeedGenerator
 from feedgen.entry import FeedEntry
-from comiccaster.feed_generator import ComicFeedGenerator
+from comiccaster.feed_generator import ComicFeedGenerator, read_feed_etag
 
 @pytest.fixture
 def comic_info():
@@ -214,10 +217,123 @@ def test_update_feed_existing(mock_exists, feed_generator, comic_info, metadata)
         assert metadata['url'] in feed_content
         assert metadata['image'] in feed_content
 
+def test_update_feed_skips_write_for_existing_entry(feed_generator, comic_info, metadata):
+    """Re-submitting an entry already in the feed does not rewrite the file."""
+    assert feed_generator.update_feed(comic_info, metadata) is True
+
+    with patch.object(feed_generator, '_write_feed') as mock_write, \
+         patch.object(feed_generator, 'create_entry') as mock_create:
+        assert feed_generator.update_feed(comic_info, metadata) is True
+        mock_write.assert_not_called()
+        mock_create.assert_not_called()
+
+def test_update_feed_appends_to_existing_entries(feed_generator, comic_info, metadata):
+    """Updates keep earlier entries and maintain the sidecar index."""
+    assert feed_generator.update_feed(comic_info, metadata) is True
+
+    second = dict(metadata, url='https://example.com/comic/2',
+                  title='Test Comic - Day 2', pub_date='Sun, 07 Apr 2024 00:00:00 -0400')
+    assert feed_generator.update_feed(comic_info, second) is True
+
+    feed_path = feed_generator.output_dir / f"{comic_info['slug']}.xml"
+    feed_content = feed_path.read_text()
+    assert feed_content.count('<item>') == 2
+    assert feed_content.index(second['url']) < feed_content.index(metadata['url'])
+
+    index = json.loads(feed_path.with_suffix('.index.json').read_text())
+    assert [item['id'] for item in index['items']] == [second['url'], metadata['url']]
+
+def test_update_feed_rebuilds_stale_index(feed_generator, comic_info, metadata):
+    """A feed rewritten by generate_feed is re-read rather than trusting the old index."""
+    assert feed_generator.update_feed(comic_info, metadata) is True
+    feed_generator.generate_feed(comic_info, [dict(metadata, url='https://example.com/comic/0',
+                                                   pub_date='Sun, 31 Dec 2023 00:00:00 +0000')])
+
+    second = dict(metadata, url='https://example.com/comic/2',
+                  pub_date='Sun, 07 Apr 2024 00:00:00 -0400')
+    assert feed_generator.update_feed(comic_info, second) is True
+
+    feed_content = (feed_generator.output_dir / f"{comic_info['slug']}.xml").read_text()
+    assert 'https://example.com/comic/0' in feed_content
+    assert second['url'] in feed_content
+    assert 'xmlns:atom' not in feed_content.split('<item>', 1)[1]
+
+def test_update_feed_rereads_feed_replaced_outside_generator(tmp_path, comic_info, metadata):
+    """An index left behind when the tracked feed XML is replaced (git pull) is not trusted."""
+    entry = lambda day: dict(metadata, url=f'https://example.com/comic/{day}',
+                             pub_date=f'Mon, 0{day} Apr 2024 00:00:00 +0000')
+    feed_path = tmp_path / f"{comic_info['slug']}.xml"
+    assert ComicFeedGenerator(output_dir=str(tmp_path)).update_feed(comic_info, entry(1)) is True
+
+    # A newer 3-item feed arrives from upstream; the gitignored sidecars stay put.
+    upstream = ComicFeedGenerator(output_dir=str(tmp_path / 'upstream'))
+    assert upstream.generate_feed(comic_info, [entry(1), entry(2), entry(3)]) is True
+    feed_path.write_bytes((upstream.output_dir / feed_path.name).read_bytes())
+
+    assert ComicFeedGenerator(output_dir=str(tmp_path)).update_feed(comic_info, entry(4)) is True
+
+    index = json.loads(feed_path.with_suffix('.index.json').read_text())
+    assert [item['id'] for item in index['items']] == [
+        f'https://example.com/comic/{day}' for day in (4, 3, 2, 1)]
+    assert feed_path.read_text().count('<item>') == 4
+
+def test_update_feed_batch_writes_once(feed_generator, comic_info, metadata):
+    """A batch update adds every new entry with a single feed write."""
+    assert feed_generator.update_feed(comic_info, metadata) is True
+    batch = [
+        metadata,  # already published
+        dict(metadata, url='https://example.com/comic/2', pub_date='Sun, 07 Apr 2024 00:00:00 -0400'),
+        dict(metadata, url='https://example.com/comic/3', pub_date='Mon, 08 Apr 2024 00:00:00 -0400'),
+    ]
+
+    with patch.object(feed_generator, '_write_feed', wraps=feed_generator._write_feed) as mock_write:
+        assert feed_generator.update_feed_batch(comic_info, batch) is True
+        assert mock_write.call_count == 1
+
+    feed_path = feed_generator.output_dir / f"{comic_info['slug']}.xml"
+    index = json.loads(feed_path.with_suffix('.index.json').read_text())
+    assert [item['id'] for item in index['items']] == [
+        'https://example.com/comic/3', 'https://example.com/comic/2', metadata['url']]
+
+def test_update_feed_reuses_items_until_feed_changes(feed_generator, comic_info, metadata):
+    """Repeated updates reuse the items held in memory while the feed file is unchanged."""
+    assert feed_generator.update_feed(comic_info, metadata) is True
+    second = dict(metadata, url='https://example.com/comic/2', pub_date='Sun, 07 Apr 2024 00:00:00 -0400')
+    with patch.object(feed_generator, '_load_index') as mock_load:
+        assert feed_generator.update_feed(comic_info, second) is True
+        mock_load.assert_not_called()
+
+    feed_path = feed_generator.output_dir / f"{comic_info['slug']}.xml"
+    stat = feed_path.stat()
+    os.utime(feed_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    with patch.object(feed_generator, '_load_index', wraps=feed_generator._load_index) as mock_load:
+        assert feed_generator.update_feed(comic_info, metadata) is True
+        mock_load.assert_called_once()
+
+def test_update_feed_index_matches_rebuilt_index(feed_generator, comic_info, metadata):
+    """Index records rendered on update match those rebuilt from the feed XML."""
+    political = dict(comic_info, is_political=True)
+    assert feed_generator.update_feed(political, dict(metadata, title='Tom & Jerry <3')) is True
+
+    feed_path = feed_generator.output_dir / f"{comic_info['slug']}.xml"
+    index = json.loads(feed_path.with_suffix('.index.json').read_text())
+    assert index['items'] == feed_generator._load_items_from_feed(feed_path)
+
+def test_update_feed_index_without_orjson(feed_generator, comic_info, metadata):
+    """The index sidecar round-trips through the stdlib json fallback."""
+    with patch('comiccaster.feed_generator._orjson', None):
+        assert feed_generator.update_feed(comic_info, metadata) is True
+        second = dict(metadata, url='https://example.com/comic/2', pub_date='Sun, 07 Apr 2024 00:00:00 -0400')
+        assert feed_generator.update_feed(comic_info, second) is True
+
+    feed_path = feed_generator.output_dir / f"{comic_info['slug']}.xml"
+    index = json.loads(feed_path.with_suffix('.index.json').read_text())
+    assert [item['id'] for item in index['items']] == [second['url'], metadata['url']]
+
 def test_update_feed_error(feed_generator, comic_info, metadata):
     """Test error handling in update_feed."""
-    with patch('feedgen.feed.FeedGenerator.rss_file') as mock_rss_file:
-        mock_rss_file.side_effect = Exception('Test error')
+    with patch('feedgen.feed.FeedGenerator.rss_str') as mock_rss_str:
+        mock_rss_str.side_effect = Exception('Test error')
         result = feed_generator.update_feed(comic_info, metadata)
         
         assert result is False
@@ -251,8 +367,187 @@ def test_generate_feed(feed_generator, comic_info):
 
 def test_generate_feed_error(feed_generator, comic_info):
     """Test error handling in generate_feed."""
-    with patch('feedgen.feed.FeedGenerator.rss_file') as mock_rss_file:
-        mock_rss_file.side_effect = Exception('Test error')
+    with patch('feedgen.feed.FeedGenerator.rss_str') as mock_rss_str:
+        mock_rss_str.side_effect = Exception('Test error')
         result = feed_generator.generate_feed(comic_info, [])
         
-        assert result is False 
\ No newline at end of file
+        assert result is False 
+
+def test_parse_date_iso_date_only(feed_generator):
+    """A bare YYYY-MM-DD date parses to midnight UTC without a regex or strptime."""
+    dt = feed_generator.parse_date_with_timezone('2024-04-06')
+    assert dt == datetime(2024, 4, 6, tzinfo=timezone.utc)
+    assert dt.utcoffset().total_seconds() == 0
+
+def test_parse_date_iso_datetime_keeps_offset(feed_generator):
+    """Full ISO 8601 timestamps take the fromisoformat path and keep their offset."""
+    dt = feed_generator.parse_date_with_timezone('2024-04-06T12:30:00-04:00')
+    assert dt == datetime(2024, 4, 6, 16, 30, tzinfo=timezone.utc)
+    assert dt.utcoffset().total_seconds() == -4 * 3600
+
+
+def test_generate_feed_writes_etag_sidecars(feed_generator, comic_info, metadata):
+    """Generating a feed records its ETag and last-modified time beside it."""
+    assert feed_generator.generate_feed(comic_info, [metadata]) is True
+
+    feed_path = feed_generator.output_dir / f"{comic_info['slug']}.xml"
+    etag_path = feed_path.with_name(feed_path.name + '.etag')
+    lastmod_path = feed_path.with_name(feed_path.name + '.lastmod')
+    etag, mtime_ns, size = etag_path.read_text().split()
+    assert len(etag) == 64
+    assert (int(mtime_ns), int(size)) == (feed_path.stat().st_mtime_ns, feed_path.stat().st_size)
+    assert read_feed_etag(feed_path) == etag
+    assert lastmod_path.read_text().endswith('GMT')
+
+
+def test_generate_feed_rewrites_feed_replaced_outside_generator(feed_generator, comic_info, metadata):
+    """A stale ETag sidecar doesn't stop the generator restoring a feed replaced on disk."""
+    feed_generator.generate_feed(comic_info, [metadata])
+    feed_path = feed_generator.output_dir / f"{comic_info['slug']}.xml"
+    etag = read_feed_etag(feed_path)
+    feed_path.write_bytes(b'<rss version="2.0"><channel/></rss>')
+
+    assert read_feed_etag(feed_path) is None
+    assert feed_generator.generate_feed(comic_info, [metadata]) is True
+    assert metadata['url'] in feed_path.read_text()
+    assert read_feed_etag(feed_path) == etag
+
+
+def test_generate_feed_skips_unchanged_write(feed_generator, comic_info, metadata):
+    """Regenerating identical content leaves the feed file untouched."""
+    feed_generator.generate_feed(comic_info, [metadata])
+    feed_path = feed_generator.output_dir / f"{comic_info['slug']}.xml"
+    first = feed_path.read_bytes()
+
+    with patch('comiccaster.feed_generator.os.replace') as mock_replace:
+        assert feed_generator.generate_feed(comic_info, [metadata]) is True
+        mock_replace.assert_not_called()
+    assert feed_path.read_bytes() == first
+
+
+def test_generate_feed_keeps_newest_entries(feed_generator, comic_info, metadata):
+    """Items are written newest first and capped at MAX_ENTRIES."""
+    entries = [dict(metadata, url=f'https://example.com/comic/{day}', pub_date=f'2024-04-{day:02d}')
+               for day in (3, 1, 4, 2)]
+    with patch.object(ComicFeedGenerator, 'MAX_ENTRIES', 3):
+        assert feed_generator.generate_feed(comic_info, entries) is True
+
+    feed_content = (feed_generator.output_dir / f"{comic_info['slug']}.xml").read_text()
+    links = re.findall(r'<link>(https://example.com/comic/\d)</link>', feed_content)
+    assert links == [f'https://example.com/comic/{day}' for day in (4, 3, 2)]
+
+
+def test_generate_feed_keeps_a_full_regenerated_feed(feed_generator, comic_info, metadata):
+    """A 100-entry regenerate (update_feeds.py's cap) keeps every entry by default."""
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    entries = [dict(metadata, url=f'https://example.com/comic/{n}',
+                    pub_date=(start + timedelta(days=n)).strftime('%Y-%m-%d'))
+               for n in range(100)]
+    assert feed_generator.generate_feed(comic_info, entries) is True
+
+    feed_path = feed_generator.output_dir / f"{comic_info['slug']}.xml"
+    assert feed_path.read_text().count('<item>') == 100
+
+    assert feed_generator.generate_feed(comic_info, entries, max_entries=10) is True
+    links = re.findall(r'<link>(https://example.com/comic/\d+)</link>', feed_path.read_text())
+    assert links == [f'https://example.com/comic/{n}' for n in range(99, 89, -1)]
+
+
+def test_generate_feed_parses_each_date_once(feed_generator, comic_info, metadata):
+    """generate_feed hands the parsed date to create_entry instead of re-parsing."""
+    entries = [dict(metadata, url=f'https://example.com/comic/{i}') for i in range(3)]
+    with patch.object(feed_generator, 'parse_date_with_timezone',
+                      wraps=feed_generator.parse_date_with_timezone) as mock_parse:
+        assert feed_generator.generate_feed(comic_info, entries) is True
+    assert mock_parse.call_count == len(entries)
+
+
+def test_generate_feed_fast_path_matches_feedgen(tmp_path, comic_info):
+    """The direct <item> renderer serializes entries exactly as feedgen does."""
+    entries = [
+        {'title': 'Tom & "Jerry" <3', 'url': 'https://example.com/1?a=1&b=2',
+         'images': [{'url': 'https://example.com/1.jpg', 'alt': 'Panel "one"'}],
+         'description': '<em>caption</em>', 'pub_date': 'Sat, 06 Apr 2024 12:00:00 -0400'},
+        {'url': 'https://example.com/2', 'image_url': 'https://example.com/2.jpg',
+         'pub_date': '2024-04-07'},
+        {'id': 'custom-id', 'description': 'Caf\u00e9', 'pub_date': '2024-04-08'},
+    ]
+
+    def render(use_fast):
+        generator = ComicFeedGenerator(output_dir=str(tmp_path / str(use_fast)))
+        generator.generate_feed(dict(comic_info, is_political=True), entries, use_fast=use_fast)
+        xml = (generator.output_dir / f"{comic_info['slug']}.xml").read_text()
+        xml = re.sub(r'<lastBuildDate>[^<]*</lastBuildDate>', '', xml)
+        return re.sub(r'<item>.*?</item>', '', xml, flags=re.S), re.findall(r'<item>.*?</item>', xml, re.S)
+
+    fast_channel, fast_items = render(True)
+    slow_channel, slow_items = render(False)
+    assert fast_channel == slow_channel
+    # feedgen's add_entry order differs across versions, so compare the items as a set.
+    assert sorted(fast_items) == sorted(slow_items)
+    assert len(fast_items) == 3
+    assert 'https://example.com/2' in fast_items[1]  # newest first
+
+
+def test_create_feed_uses_given_updated_time(feed_generator, comic_info):
+    """create_feed stamps lastBuildDate with the supplied time."""
+    updated = datetime(2024, 4, 6, 12, 0, tzinfo=timezone.utc)
+    rss = feed_generator.create_feed(comic_info, updated_time=updated).rss_str()
+    assert b'<lastBuildDate>Sat, 06 Apr 2024 12:00:00 +0000</lastBuildDate>' in rss
+
+
+def test_generate_all(tmp_path, comic_info, metadata):
+    """generate_all writes every feed and returns per-job results in order."""
+    jobs = [(dict(comic_info, slug=f'comic-{i}'), [metadata]) for i in range(4)]
+    jobs.append((dict(comic_info, slug='broken'), None))  # generate_feed fails
+
+    results = ComicFeedGenerator.generate_all(jobs, max_workers=2, output_dir=str(tmp_path))
+
+    assert results == [True, True, True, True, False]
+    assert all((tmp_path / f'comic-{i}.xml').exists() for i in range(4))
+    build_dates = {re.search(r'<lastBuildDate>([^<]*)</lastBuildDate>',
+                             (tmp_path / f'comic-{i}.xml').read_text()).group(1) for i in range(4)}
+    assert len(build_dates) == 1
+
+
+def test_write_feed_keeps_old_feed_on_failed_write(feed_generator, comic_info, metadata):
+    """A failed write leaves the previous feed intact instead of truncating it."""
+    feed_generator.generate_feed(comic_info, [metadata])
+    feed_path = feed_generator.output_dir / f"{comic_info['slug']}.xml"
+    first = feed_path.read_bytes()
+
+    with patch('comiccaster.feed_generator.os.replace', side_effect=OSError('disk full')):
+        assert feed_generator.generate_feed(comic_info, [dict(metadata, url='https://example.com/2')]) is False
+    assert feed_path.read_bytes() == first
+
+
+def test_single_image_escapes_scraped_values(feed_generator):
+    """The single-image path escapes the URL and comic name but keeps description HTML."""
+    content = feed_generator._create_single_image_content(
+        'https://example.com/a.jpg?x=1&y="2"', '<em>caption</em>', {'name': 'Tom & Jerry'})
+    assert 'src="https://example.com/a.jpg?x=1&amp;y=&#34;2&#34;"' in content
+    assert 'alt="Tom &amp; Jerry"' in content
+    assert '<p style="margin-top: 10px; font-style: italic;"><em>caption</em></p>' in content
+
+
+def test_multi_image_escapes_scraped_attributes(feed_generator, comic_info):
+    """Scraped alt/title text is escaped; the generator-built description is not."""
+    images = [{'url': 'https://example.com/p1.jpg', 'alt': 'Say "hi" <b>', 'title': 'A & B'}]
+    content = feed_generator._create_multi_image_content(images, '<em>caption</em>', comic_info)
+    assert 'alt="Say &#34;hi&#34; &lt;b&gt;"' in content
+    assert 'title="A &amp; B"' in content
+    assert '<em>caption</em>' in content
+
+
+def test_parse_date_is_memoized(feed_generator):
+    """Repeated date strings are parsed once; unparseable ones are never cached."""
+    from comiccaster.feed_generator import _parse_date_cached
+    _parse_date_cached.cache_clear()
+
+    first = feed_generator.parse_date_with_timezone('Sat, 06 Apr 2024 00:00:00 -0400')
+    second = feed_generator.parse_date_with_timezone('Sat, 06 Apr 2024 00:00:00 -0400')
+    assert first is second
+    assert _parse_date_cached.cache_info().hits == 1
+
+    feed_generator.parse_date_with_timezone('invalid date')
+    assert _parse_date_cached.cache_info().currsize == 1
@@ -0,0 +1,300 @@
+"""Tests for the GoComics scraper.
+
+Network-free: HTML is supplied inline and the fetch boundary is patched, so
+these tests never hit gocomics.com.
+"""
+
+from unittest.mock import patch
+
+
+COMIC_HTML = '''
+<html>
+  <head>
+    <title>Garfield by Jim Davis</title>
+    <meta property="og:title" content="Garfield for January 02, 2024">
+    <meta property="og:description" content="Garfield strip">
+    <meta name="author" content="Jim Davis">
+  </head>
+  <body>
+    <picture class="item-comic-image">
+      <img src="https://assets.amuniversal.com/abc123" alt="Garfield">
+    </picture>
+  </body>
+</html>
+'''
+
+
+class TestScrapeComic:
+    def test_extracts_image_and_metadata(self):
+        from comiccaster.gocomics_scraper import GoComicsScraper
+
+        scraper = GoComicsScraper()
+        with patch.object(scraper, 'fetch_comic_page', return_value=COMIC_HTML):
+            result = scraper.scrape_comic('garfield', '2024/01/02')
+
+        assert result['image_url'] == 'https://assets.amuniversal.com/abc123'
+        assert result['title'] == 'Garfield for January 02, 2024'
+        assert result['author'] == 'Jim Davis'
+
+    def test_extractors_accept_raw_html(self):
+        from comiccaster.gocomics_scraper import GoComicsScraper
+
+        scraper = GoComicsScraper()
+        images = scraper.extract_images(COMIC_HTML, 'garfield', '2024/01/02')
+        metadata = scraper.extract_metadata(COMIC_HTML, 'garfield', '2024/01/02')
+
+        assert images[0]['alt'] == 'Garfield'
+        assert metadata['description'] == 'Garfield strip'
+
+
+class TestComicPrefix:
+    def test_cuts_after_comic_picture(self):
+        from comiccaster.gocomics_scraper import _comic_prefix
+
+        html = COMIC_HTML.replace('</body>', '<script>' + 'x' * 1000 + '</script></body>')
+        prefix = _comic_prefix(html)
+
+        assert prefix.endswith('</picture>')
+        assert 'og:title' in prefix and '<script>' not in prefix
+
+    def test_keeps_page_without_comic_picture(self):
+        from comiccaster.gocomics_scraper import _comic_prefix
+
+        html = '<div class="item-comic-image"></div><picture><img src="a"></picture><img src="b">'
+        assert _comic_prefix(html) == html
+        assert _comic_prefix('<html></html>') == '<html></html>'
+
+    def test_scrape_result_unchanged_by_trailing_body(self):
+        from comiccaster.gocomics_scraper import GoComicsScraper
+
+        scraper = GoComicsScraper()
+        tail = '<img src="https://assets.amuniversal.com/other"><title>svg</title></body>'
+        with patch.object(scraper, 'fetch_comic_page', return_value=COMIC_HTML):
+            plain = scraper.scrape_comic('garfield', '2024/01/02')
+        with patch.object(scraper, 'fetch_comic_page',
+                          return_value=COMIC_HTML.replace('</body>', tail)):
+            padded = scraper.scrape_comic('garfield', '2024/01/02')
+
+        assert padded == plain
+
+
+class TestFetchComicPages:
+    def test_fetches_every_date(self):
+        from comiccaster.gocomics_scraper import GoComicsScraper
+
+        scraper = GoComicsScraper()
+        dates = ['2024/01/01', '2024/01/02', '2024/01/03']
+
+        def fake_fetch(slug, date):
+            if date == '2024/01/02':
+                raise RuntimeError('boom')
+            return f"<html>{slug} {date}</html>"
+
+        with patch.object(scraper, 'fetch_comic_page', side_effect=fake_fetch):
+            pages = scraper.fetch_comic_pages('garfield', dates)
+
+        assert pages == {
+            '2024/01/01': '<html>garfield 2024/01/01</html>',
+            '2024/01/02': None,
+            '2024/01/03': '<html>garfield 2024/01/03</html>',
+        }
+
+    def test_no_dates(self):
+        from comiccaster.gocomics_scraper import GoComicsScraper
+
+        assert GoComicsScraper().fetch_comic_pages('garfield', []) == {}
+
+
+class TestScrapeMany:
+    def test_scrapes_every_job(self):
+        from comiccaster.gocomics_scraper import GoComicsScraper
+
+        scraper = GoComicsScraper()
+        jobs = [('garfield', '2024/01/02'), ('peanuts', '2024/01/02'), ('garfield', '2024/01/03')]
+
+        def fake_scrape(slug, date):
+            if slug == 'peanuts':
+                raise RuntimeError('boom')
+            return {'slug': slug, 'date': date}
+
+        with patch.object(scraper, 'scrape_comic', side_effect=fake_scrape):
+            results = scraper.scrape_many(jobs, max_workers=2)
+
+        assert results == {
+            ('garfield', '2024/01/02'): {'slug': 'garfield', 'date': '2024/01/02'},
+            ('peanuts', '2024/01/02'): None,
+            ('garfield', '2024/01/03'): {'slug': 'garfield', 'date': '2024/01/03'},
+        }
+
+    def test_no_jobs(self):
+        from comiccaster.gocomics_scraper import GoComicsScraper
+
+        assert GoComicsScraper().scrape_many([]) == {}
+
+
+class TestFetchComicPage:
+    def _response(self, status_code, text):
+        from unittest.mock import Mock
+
+        return Mock(status_code=status_code, text=text, content=text.encode())
+
+    def test_rendered_page_skips_selenium(self):
+        from comiccaster.gocomics_scraper import GoComicsScraper
+
+        scraper = GoComicsScraper()
+        with patch.object(scraper.session, 'get', return_value=self._response(200, COMIC_HTML)), \
+             patch.object(scraper, '_fetch_with_selenium') as selenium:
+            assert scraper.fetch_comic_page('garfield', '2024/01/02') == COMIC_HTML
+
+        selenium.assert_not_called()
+
+    def test_page_without_comic_image_falls_back_to_selenium(self):
+        from comiccaster.gocomics_scraper import GoComicsScraper
+
+        scraper = GoComicsScraper()
+        with patch.object(scraper.session, 'get', return_value=self._response(200, '<html></html>')), \
+             patch.object(scraper, '_fetch_with_selenium', return_value=COMIC_HTML) as selenium:
+            assert scraper.fetch_comic_page('garfield', '2024/01/02') == COMIC_HTML
+
+        selenium.assert_called_once_with('https://www.gocomics.com/garfield/2024/01/02')
+
+    def test_og_image_only_page_skips_selenium(self):
+        from comiccaster.gocomics_scraper import GoComicsScraper
+
+        html = '<html><head><meta property="og:image" content="https://assets.amuniversal.com/x"></head></html>'
+        scraper = GoComicsScraper()
+        with patch.object(scraper.session, 'get', return_value=self._response(200, html)), \
+             patch.object(scraper, '_fetch_with_selenium') as selenium:
+            assert scraper.fetch_comic_page('garfield', '2024/01/02') == html
+
+        selenium.assert_not_called()
+
+    def test_counts_fast_path_hits_and_fallbacks(self, caplog):
+        import logging
+        from comiccaster.gocomics_scraper import GoComicsScraper
+
+        responses = [self._response(200, COMIC_HTML), self._response(200, COMIC_HTML),
+                     self._response(200, '<html></html>'), self._response(404, '')]
+        with GoComicsScraper() as scraper:
+            with patch.object(scraper.session, 'get', side_effect=responses), \
+                 patch.object(scraper, '_fetch_with_selenium', return_value=COMIC_HTML):
+                for day in range(4):
+                    scraper.fetch_comic_page('garfield', f'2024/01/0{day + 1}')
+            caplog.set_level(logging.INFO, logger='comiccaster.gocomics_scraper')
+
+        assert scraper.fetch_stats == {'http': 2, 'selenium': 1}
+        assert 'HTTP fast path served 2/3 pages (67%); 1 needed Selenium' in caplog.text
+
+    def test_not_found_returns_none(self):
+        from comiccaster.gocomics_scraper import GoComicsScraper
+
+        scraper = GoComicsScraper()
+        with patch.object(scraper.session, 'get', return_value=self._response(404, '')), \
+             patch.object(scraper, '_fetch_with_selenium') as selenium:
+            assert scraper.fetch_comic_page('garfield', '2024/01/02') is None
+
+        selenium.assert_not_called()
+
+
+class TestSeleniumDriverReuse:
+    URL = 'https://www.gocomics.com/garfield/2024/01/02'
+
+    def _scraper(self, driver):
+        from comiccaster.gocomics_scraper import GoComicsScraper
+
+        scraper = GoComicsScraper()
+        scraper.driver = driver
+        return scraper
+
+    def test_context_reuses_one_driver_and_quits_on_exit(self):
+        from unittest.mock import Mock
+
+        driver = Mock(**{'execute_script.return_value': COMIC_HTML})
+        with self._scraper(driver) as scraper:
+            assert scraper._fetch_with_selenium(self.URL) == COMIC_HTML
+            assert scraper._fetch_with_selenium(self.URL) == COMIC_HTML
+            assert scraper.driver is driver
+            driver.quit.assert_not_called()
+
+        assert driver.get.call_count == 2
+        assert driver.delete_all_cookies.call_count == 2
+        driver.quit.assert_called_once()
+        assert scraper.driver is None
+
+    def test_browser_markup_scrapes_like_full_page(self):
+        """The in-browser extract (<head> + comic <picture>) yields the same result."""
+        from comiccaster.gocomics_scraper import GoComicsScraper
+
+        head = COMIC_HTML[COMIC_HTML.index('<head>'):COMIC_HTML.index('</head>') + len('</head>')]
+        picture = COMIC_HTML[COMIC_HTML.index('<picture'):COMIC_HTML.index('</picture>') + len('</picture>')]
+        reduced = f'<html>{head}<body>{picture}</body></html>'
+
+        scraper = GoComicsScraper()
+        with patch.object(scraper, 'fetch_comic_page', return_value=COMIC_HTML):
+            full = scraper.scrape_comic('garfield', '2024/01/02')
+        with patch.object(scraper, 'fetch_comic_page', return_value=reduced):
+            assert scraper.scrape_comic('garfield', '2024/01/02') == full
+
+    def test_timeout_keeps_driver(self):
+        from unittest.mock import Mock
+        from selenium.common.exceptions import TimeoutException
+
+        driver = Mock(**{'get.side_effect': TimeoutException('slow')})
+        scraper = self._scraper(driver)
+
+        assert scraper._fetch_with_selenium(self.URL) is None
+        assert scraper.driver is driver
+
+    def test_dead_session_is_replaced_and_retried_once(self):
+        from unittest.mock import Mock
+        from selenium.common.exceptions import InvalidSessionIdException
+
+        dead = Mock(**{
+            'get.side_effect': InvalidSessionIdException('session deleted'),
+            'quit.side_effect': InvalidSessionIdException('no such session'),
+        })
+        fresh = Mock(**{'execute_script.return_value': COMIC_HTML})
+        scraper = self._scraper(dead)
+
+        def start_fresh():
+            if scraper.driver is None:
+                scraper.driver = fresh
+
+        with patch.object(scraper, 'setup_driver', side_effect=start_fresh):
+            assert scraper._fetch_with_selenium(self.URL) == COMIC_HTML
+
+        dead.quit.assert_called_once()
+        assert scraper.driver is fresh
+
+    def test_gives_up_after_one_restart(self):
+        from unittest.mock import Mock
+        from selenium.common.exceptions import WebDriverException
+
+        drivers = []
+
+        def start_broken():
+            if scraper.driver is None:
+                scraper.driver = Mock(**{'get.side_effect': WebDriverException('crashed')})
+                drivers.append(scraper.driver)
+
+        scraper = self._scraper(None)
+        with patch.object(scraper, 'setup_driver', side_effect=start_broken):
+            assert scraper._fetch_with_selenium(self.URL) is None
+
+        assert len(drivers) == 2
+        assert scraper.driver is None
+
+
+class TestExtractImagesFallback:
+    def test_matches_asset_images_by_slug(self):
+        from comiccaster.gocomics_scraper import GoComicsScraper
+
+        html = '''
+        <img src="https://www.gocomics.com/logo.png">
+        <img src="https://ASSETS.amuniversal.com/garfield/strip.gif" alt="strip">
+        <img src="https://assets.amuniversal.com/heathcliff/strip.gif">
+        <img src="https://evil.example/?u=//assets.amuniversal.com/garfield/x.gif">
+        '''
+        images = GoComicsScraper().extract_images(html, 'garfield', '2024/01/02')
+
+        assert [image['url'] for image in images] == ['https://ASSETS.amuniversal.com/garfield/strip.gif']
@@ -0,0 +1,233 @@
+"""Tests for the New Yorker Daily Cartoon scraper.
+
+Network-free: HTML is supplied inline and the fetch boundary is patched, so
+these tests never hit newyorker.com.
+"""
+
+from unittest.mock import patch
+
+
+LISTING_HTML = '''
+<html>
+  <body>
+    <a href="/cartoons/daily-cartoon">Daily Cartoon</a>
+    <a href="/cartoons/daily-cartoon/friday-december-12th-a-i-slop">Friday, December 12th: A.I. Slop</a>
+    <a href="/cartoons/daily-cartoon/friday-december-12th-a-i-slop">Friday, December 12th: A.I. Slop</a>
+    <a href="/cartoons/daily-cartoon/short">Short</a>
+    <a href="/cartoons/daily-cartoon/thursday-december-11th-snow-day">Thursday, December 11th: Snow Day</a>
+    <a href="/humor/shouts-murmurs">Shouts &amp; Murmurs</a>
+  </body>
+</html>
+'''
+
+CARTOON_HTML = '''
+<html>
+  <head><title>Daily Cartoon: Friday, December 12th | The New Yorker</title></head>
+  <body>
+    <img src="https://media.newyorker.com/photos/logo.png" alt="logo">
+    <img src="https://media.newyorker.com/cartoons/abc/thumb.jpg" alt="thumb">
+    <img src="https://media.newyorker.com/cartoons/abc/master/w_1600.jpg" alt="A robot at a desk">
+    <p>“I just generated this.”</p><p>Cartoon by Jane Doe</p><p>Copy link</p>
+    <ul>
+      <li><a href="/humor/daily-shouts/one">One</a> by Someone</li>
+      <li><a href="/culture/other">Not humor</a></li>
+    </ul>
+  </body>
+</html>
+'''
+
+
+def _response(text, status_code=200, headers=None):
+    from unittest.mock import Mock
+
+    return Mock(status_code=status_code, text=text, headers=headers or {})
+
+
+def _scraper():
+    from comiccaster.newyorker_scraper import NewYorkerScraper
+    return NewYorkerScraper()
+
+
+class TestGetCartoonList:
+    def test_dedupes_and_skips_short_and_listing_links(self):
+        scraper = _scraper()
+        with patch.object(scraper, '_get', return_value=_response(LISTING_HTML)):
+            cartoons = scraper.get_cartoon_list()
+
+        assert cartoons == [
+            {
+                'title': 'Friday, December 12th: A.I. Slop',
+                'url': 'https://www.newyorker.com/cartoons/daily-cartoon/friday-december-12th-a-i-slop',
+            },
+            {
+                'title': 'Thursday, December 11th: Snow Day',
+                'url': 'https://www.newyorker.com/cartoons/daily-cartoon/thursday-december-11th-snow-day',
+            },
+        ]
+
+    def test_dedupes_relative_and_absolute_forms(self):
+        html = LISTING_HTML.replace(
+            '<a href="/cartoons/daily-cartoon/short">',
+            '<a href="https://www.newyorker.com/cartoons/daily-cartoon/friday-december-12th-a-i-slop">'
+            'Friday, December 12th: A.I. Slop</a><a href="/cartoons/daily-cartoon/short">',
+        )
+        scraper = _scraper()
+        with patch.object(scraper, '_get', return_value=_response(html)):
+            cartoons = scraper.get_cartoon_list()
+
+        assert len(cartoons) == 2
+
+    def test_respects_max_cartoons(self):
+        scraper = _scraper()
+        with patch.object(scraper, '_get', return_value=_response(LISTING_HTML)):
+            assert len(scraper.get_cartoon_list(max_cartoons=1)) == 1
+
+    def test_unchanged_listing_is_served_from_cache(self):
+        scraper = _scraper()
+        first = _response(LISTING_HTML, headers={'ETag': '"v1"', 'Last-Modified': 'Fri, 12 Dec 2025 10:00:00 GMT'})
+        with patch.object(scraper, '_get', return_value=first):
+            cartoons = scraper.get_cartoon_list()
+
+        with patch.object(scraper, '_get', return_value=_response('', status_code=304)) as get:
+            assert scraper.get_cartoon_list() == cartoons
+            assert scraper.get_cartoon_list(max_cartoons=1) == cartoons[:1]
+
+        get.assert_called_with(scraper.LISTING_URL, headers={
+            'If-None-Match': '"v1"',
+            'If-Modified-Since': 'Fri, 12 Dec 2025 10:00:00 GMT',
+        })
+
+    def test_larger_request_than_cached_fetches_unconditionally(self):
+        scraper = _scraper()
+        html = LISTING_HTML.replace('</body>', ''.join(
+            f'<a href="/cartoons/daily-cartoon/extra-{i}">Extra cartoon number {i}</a>' for i in range(3)
+        ) + '</body>')
+        with patch.object(scraper, '_get', return_value=_response(html, headers={'ETag': '"v1"'})):
+            scraper.get_cartoon_list(max_cartoons=2)
+
+        with patch.object(scraper, '_get', return_value=_response(html, headers={'ETag': '"v1"'})) as get:
+            assert len(scraper.get_cartoon_list(max_cartoons=4)) == 4
+
+        get.assert_called_once_with(scraper.LISTING_URL, headers=None)
+
+
+class TestScrapeCartoonPage:
+    URL = 'https://www.newyorker.com/cartoons/daily-cartoon/friday-december-12th-a-i-slop'
+
+    def test_extracts_cartoon_details(self):
+        scraper = _scraper()
+        with patch.object(scraper, '_fetch_page', return_value=CARTOON_HTML):
+            result = scraper.scrape_cartoon_page(self.URL)
+
+        assert result['image_url'] == 'https://media.newyorker.com/cartoons/abc/master/w_1600.jpg'
+        assert result['image_alt'] == 'A robot at a desk'
+        assert result['caption'] == '"I just generated this."'
+        assert result['author'] == 'Jane Doe'
+        assert result['title'] == 'Daily Cartoon: Friday, December 12th'
+        assert result['date'].endswith('-12-12')
+        assert result['humor_links'] == [{
+            'title': 'One by Someone',
+            'url': 'https://www.newyorker.com/humor/daily-shouts/one',
+        }]
+
+    def test_ignores_script_text_when_finding_caption(self):
+        html = CARTOON_HTML.replace(
+            '<head>', '<head><script>var s = "\u201cbait\u201dCartoon by Bot";</script>'
+        )
+        scraper = _scraper()
+        with patch.object(scraper, '_fetch_page', return_value=html):
+            result = scraper.scrape_cartoon_page(self.URL)
+
+        assert result['caption'] == '"I just generated this."'
+        assert result['author'] == 'Jane Doe'
+
+    def test_defaults_when_page_has_no_byline(self):
+        html = CARTOON_HTML.replace('Cartoon by Jane Doe', 'Jane Doe')
+        scraper = _scraper()
+        with patch.object(scraper, '_fetch_page', return_value=html):
+            result = scraper.scrape_cartoon_page(self.URL)
+
+        assert result['caption'] == ''
+        assert result['author'] == 'The New Yorker'
+
+    def test_falls_back_to_first_cartoon_image_without_master(self):
+        html = CARTOON_HTML.replace('/master/', '/full/')
+        scraper = _scraper()
+        with patch.object(scraper, '_fetch_page', return_value=html):
+            result = scraper.scrape_cartoon_page(self.URL)
+
+        assert result['image_url'] == 'https://media.newyorker.com/cartoons/abc/thumb.jpg'
+        assert result['image_alt'] == 'thumb'
+
+    def test_humor_links_use_each_items_first_link_and_stop_at_six(self):
+        items = ''.join(f'<li><a href="/humor/{i}">Piece {i}</a></li>' for i in range(8))
+        html = CARTOON_HTML.replace(
+            '<ul>', '<ul><li><a href="/news/x">News</a> <a href="/humor/skip">Skip</a></li>' + items
+        )
+        scraper = _scraper()
+        with patch.object(scraper, '_fetch_page', return_value=html):
+            result = scraper.scrape_cartoon_page(self.URL)
+
+        assert [link['title'] for link in result['humor_links']] == [
+            f'Piece {i}' for i in range(6)
+        ]
+
+    def test_returns_none_without_cartoon_image(self):
+        scraper = _scraper()
+        html = '<html><head><title>x</title></head><body></body></html>'
+        with patch.object(scraper, '_fetch_page', return_value=html):
+            assert scraper.scrape_cartoon_page(self.URL) is None
+
+
+class TestExtractImages:
+    def test_extracts_only_cartoon_images(self):
+        images = _scraper().extract_images(CARTOON_HTML, 'newyorker', '2025-12-12')
+
+        assert [i['url'] for i in images] == [
+            'https://media.newyorker.com/cartoons/abc/thumb.jpg',
+            'https://media.newyorker.com/cartoons/abc/master/w_1600.jpg',
+        ]
+
+    def test_blank_html_yields_no_images(self):
+        assert _scraper().extract_images('   ', 'newyorker', '2025-12-12') == []
+
+
+class TestScrapeComic:
+    def test_scrapes_pages_in_listing_order_and_drops_failures(self):
+        scraper = _scraper()
+        listing = [{'title': f'Cartoon {i}', 'url': f'u{i}'} for i in range(6)]
+
+        def scrape_page(url):
+            return None if url == 'u3' else {'url': url}
+
+        with patch.object(scraper, 'get_cartoon_list', return_value=listing), \
+             patch.object(scraper, 'scrape_cartoon_page', side_effect=scrape_page):
+            result = scraper.scrape_comic('newyorker', '2025-12-12')
+
+        assert [c['url'] for c in result['cartoons']] == ['u0', 'u1', 'u2', 'u4', 'u5']
+
+
+class TestRateLimit:
+    def test_concurrent_callers_get_spaced_slots(self):
+        from concurrent.futures import ThreadPoolExecutor
+        import comiccaster.newyorker_scraper as module
+
+        scraper = _scraper()
+        sleeps = []
+        with patch.object(module.time, 'monotonic', return_value=1000.0), \
+             patch.object(module.time, 'sleep', side_effect=sleeps.append):
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                list(executor.map(lambda _: scraper._rate_limit(), range(4)))
+
+        delay = scraper.REQUEST_DELAY
+        assert sorted(sleeps) == [delay, 2 * delay, 3 * delay]
+
+    def test_first_request_does_not_wait(self):
+        import comiccaster.newyorker_scraper as module
+
+        scraper = _scraper()
+        with patch.object(module.time, 'monotonic', return_value=0.5), \
+             patch.object(module.time, 'sleep') as sleep:
+            scraper._rate_limit()
+
+        sleep.assert_not_called()
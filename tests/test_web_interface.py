@@ -6,6 +6,7 @@ import os
 import tempfile
 import pytest
 from comiccaster.web_interface import app
+from comiccaster.feed_generator import write_feed_etag
 from flask import Response
 
 @pytest.fixture
@@ -74,6 +75,43 @@ def test_individual_feed_access(client):
         # Restore original function
         app.view_functions['individual_feed'] = original_feed_function
 
+def test_individual_feed_conditional_request(client, tmp_path, monkeypatch):
+    """A feed with an ETag sidecar answers a matching If-None-Match with 304."""
+    monkeypatch.chdir(tmp_path)
+    feeds_dir = tmp_path / 'feeds'
+    feeds_dir.mkdir()
+    feed_path = feeds_dir / 'testcomic.xml'
+    feed_path.write_text('<rss version="2.0"><channel/></rss>')
+    write_feed_etag(feed_path, 'abc123')
+    (feeds_dir / 'testcomic.xml.lastmod').write_text('Sat, 06 Apr 2024 00:00:00 GMT')
+
+    response = client.get('/rss/testcomic')
+    assert response.status_code == 200
+    assert response.headers['ETag'] == 'W/"abc123"'
+    assert response.headers['Last-Modified'] == 'Sat, 06 Apr 2024 00:00:00 GMT'
+
+    for if_none_match in ('W/"abc123"', '"abc123"'):
+        response = client.get('/rss/testcomic', headers={'If-None-Match': if_none_match})
+        assert response.status_code == 304
+        assert response.data == b''
+
+def test_individual_feed_ignores_stale_etag(client, tmp_path, monkeypatch):
+    """A feed replaced after its ETag sidecar was written is served in full, without the old ETag."""
+    monkeypatch.chdir(tmp_path)
+    feeds_dir = tmp_path / 'feeds'
+    feeds_dir.mkdir()
+    feed_path = feeds_dir / 'testcomic.xml'
+    feed_path.write_text('<rss version="2.0"><channel/></rss>')
+    write_feed_etag(feed_path, 'abc123')
+    (feeds_dir / 'testcomic.xml.lastmod').write_text('Sat, 06 Apr 2024 00:00:00 GMT')
+    feed_path.write_text('<rss version="2.0"><channel><title>new</title></channel></rss>')
+
+    response = client.get('/rss/testcomic', headers={'If-None-Match': 'W/"abc123"'})
+    assert response.status_code == 200
+    assert b'<title>new</title>' in response.data
+    assert 'ETag' not in response.headers
+    assert 'Last-Modified' not in response.headers
+
 def test_generate_opml(client):
     """Test generating an OPML file."""
     # Set up test comics data